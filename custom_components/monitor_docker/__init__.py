@@ -185,7 +185,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         raise
     except Exception as err:
         _LOGGER.error(
-            "[%s]: Failed to setup, error=%s", entry.data[CONF_NAME], str(err)
+            "[%s]: Failed to setup, error=%s", entry.data[CONF_NAME], err
         )
         if api:
             await api.destroy()
@@ -289,7 +289,7 @@ async def async_migrate_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             installed_version,
             installed_minor_version,
         )
-        _LOGGER.error(str(err))
+        _LOGGER.error("%s", err)
         return False
 
     hass.config_entries.async_update_entry(
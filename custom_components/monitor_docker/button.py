@@ -2,7 +2,6 @@
 
 import asyncio
 import logging
-import re
 from typing import Any
 
 import voluptuous as vol
@@ -12,10 +11,8 @@ from homeassistant.components.button import ENTITY_ID_FORMAT, ButtonEntity
 from homeassistant.const import CONF_NAME
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import config_validation as cv
-from homeassistant.helpers import entity_platform
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
-from homeassistant.util import slugify
 
 from .const import (
     API,
@@ -23,7 +20,6 @@ from .const import (
     ATTR_SERVER,
     CONF_CONTAINERS,
     CONF_CONTAINERS_EXCLUDE,
-    CONF_RENAME,
     CONF_BUTTONENABLED,
     CONFIG,
     CONTAINER,
@@ -31,7 +27,7 @@ from .const import (
     DOMAIN,
     SERVICE_RESTART,
 )
-from .helpers import DockerAPI, DockerContainerAPI, DockerContainerEntity
+from .helpers import DockerContainerAPI, DockerContainerEntity
 
 
 SERVICE_RESTART_SCHEMA = vol.Schema({ATTR_NAME: cv.string, ATTR_SERVER: cv.string})
@@ -65,13 +61,17 @@ async def async_setup_platform(
         cname = parm.data[ATTR_NAME]
         cserver = parm.data.get(ATTR_SERVER, None)
 
-        server_name = name
+        # Resolve the server at call time, default to the first configured one
+        server_name = next(iter(hass.data[DOMAIN]), None)
         if cserver is not None:
             if cserver not in hass.data[DOMAIN]:
                 _LOGGER.error("Server '%s' is not configured", cserver)
                 return
             else:
                 server_name = cserver
+        elif server_name is None:
+            _LOGGER.error("Service restart failed, no server is configured")
+            return
 
         server_config = hass.data[DOMAIN][server_name][CONFIG]
         server_api = hass.data[DOMAIN][server_name][API]
@@ -119,19 +119,19 @@ async def async_setup_platform(
     else:
         clist = api.list_containers()
 
-    for cname in clist:
-        includeContainer = False
-        if cname in config[CONF_CONTAINERS] or not config[CONF_CONTAINERS]:
-            includeContainer = True
+    # Convert the filters once, instead of a list search per container
+    included = frozenset(config[CONF_CONTAINERS] or ())
+    excluded = frozenset(config[CONF_CONTAINERS_EXCLUDE] or ())
+    enabled_all = config[CONF_BUTTONENABLED] == True
+    enabled = frozenset() if enabled_all else frozenset(config[CONF_BUTTONENABLED])
 
-        if config[CONF_CONTAINERS_EXCLUDE] and cname in config[CONF_CONTAINERS_EXCLUDE]:
-            includeContainer = False
+    for cname in clist:
+        includeContainer = (not included or cname in included) and (
+            cname not in excluded
+        )
 
         if includeContainer:
-            if (
-                config[CONF_BUTTONENABLED] == True
-                or cname in config[CONF_BUTTONENABLED]
-            ):
+            if enabled_all or cname in enabled:
                 _LOGGER.debug("[%s] %s: Adding component Button", instance, cname)
 
                 buttons.append(
@@ -148,19 +148,24 @@ async def async_setup_platform(
         _LOGGER.info("[%s]: No containers set-up", instance)
         return False
 
-    async_add_entities(buttons, True)
+    async_add_entities(buttons, False)
 
     # platform = entity_platform.current_platform.get()
     # platform.async_register_entity_service(SERVICE_RESTART, {}, "async_restart")
-    hass.services.async_register(
-        DOMAIN, SERVICE_RESTART, async_restart, schema=SERVICE_RESTART_SCHEMA
-    )
+    # The service is shared by all servers and platforms, only register it once
+    if not hass.services.has_service(DOMAIN, SERVICE_RESTART):
+        hass.services.async_register(
+            DOMAIN, SERVICE_RESTART, async_restart, schema=SERVICE_RESTART_SCHEMA
+        )
 
     return True
 
 
 #################################################################
 class DockerContainerButton(ButtonEntity, DockerContainerEntity):
+    # The Home Assistant base classes keep their __dict__ for the _attr_* fields
+    __slots__ = ("_container", "_instance", "_cname", "_state", "_removed")
+
     def __init__(
         self,
         container: DockerContainerAPI,
@@ -173,13 +178,12 @@ class DockerContainerButton(ButtonEntity, DockerContainerEntity):
         self._instance = instance
         self._cname = cname
         self._state = False
-        self._attr_unique_id = ENTITY_ID_FORMAT.format(
-            slugify(f"{self._instance}_{self._cname}_restart")
-        )
+        slug = container.slug
+        self._attr_unique_id = ENTITY_ID_FORMAT.format(f"{slug}_restart")
 
         self._attr_has_entity_name = True
         self._attr_name = "Restart container"
-        self.entity_id = f"button.{self._instance}_{self._cname}_restart"
+        self.entity_id = f"button.{slug}_restart"
         self._removed = False
 
     @property
@@ -199,7 +203,7 @@ class DockerContainerButton(ButtonEntity, DockerContainerEntity):
         return self._state
 
     async def async_press(self, **kwargs: Any) -> None:
-        await self._container.restart()
+        await self._container.restart(source="button")
         self._state = False
         self.async_schedule_update_ha_state()
 
@@ -226,13 +230,13 @@ class DockerContainerButton(ButtonEntity, DockerContainerEntity):
         state = None
 
         try:
-            info = self._container.get_info()
+            info = self._container.info
         except Exception as err:
             _LOGGER.error(
                 "[%s] %s: Cannot request container info (%s)",
                 self._instance,
                 name,
-                str(err),
+                err,
             )
         else:
             if info is not None:
@@ -47,6 +47,22 @@ SERVICE_RESTART = "restart"
 
 PRECISION = 2
 
+# Docker info (including number of images) is fully refreshed at this interval (seconds)
+DOCKER_INFO_REFRESH = 60
+
+# Maximum number of concurrent container info/stats requests per Docker instance
+MAX_CONCURRENT_REQUESTS = 16
+
+# Delay (seconds) before a created container is monitored, and its retries
+EVENT_CREATE_DELAY = 3
+EVENT_CREATE_RETRIES = 3
+EVENT_RETRY_MAX = 30
+
+# Container event actions which change the docker info counters
+DOCKER_INFO_EVENTS = frozenset(
+    ("create", "destroy", "start", "die", "pause", "unpause", "oom")
+)
+
 DOCKER_INFO_VERSION = "version"
 DOCKER_INFO_CONTAINER_RUNNING = "containers_running"
 DOCKER_INFO_CONTAINER_PAUSED = "containers_paused"
@@ -2,20 +2,28 @@
 
 import asyncio
 import concurrent
+import inspect
 import logging
 import os
+import random
 import ssl
+import sys
+import threading
+import time
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Callable
+from typing import Any, Callable, ClassVar
+from urllib.parse import urlsplit, urlunsplit
 
 import aiodocker
-from aiohttp import ClientSession, ClientTimeout, TCPConnector
+from aiohttp import ClientSession, ClientTimeout, TCPConnector, UnixConnector
 from homeassistant.exceptions import ConfigEntryAuthFailed
 from homeassistant.helpers.device_registry import DeviceEntryType, DeviceInfo
 from homeassistant.helpers.entity import Entity
 import homeassistant.util.dt as dt_util
-from dateutil import parser, relativedelta
+from homeassistant.util import slugify
+from dateutil import parser
 from homeassistant.const import (
     CONF_NAME,
     CONF_SCAN_INTERVAL,
@@ -23,7 +31,7 @@ from homeassistant.const import (
     EVENT_HOMEASSISTANT_STOP,
 )
 from homeassistant.core import Event, HomeAssistant
-from homeassistant.helpers.discovery import load_platform
+from homeassistant.helpers.discovery import async_load_platform
 from homeassistant.helpers.typing import ConfigType
 
 from .const import (
@@ -62,13 +70,19 @@ from .const import (
     DOCKER_INFO_CONTAINER_RUNNING,
     DOCKER_INFO_CONTAINER_STOPPED,
     DOCKER_INFO_CONTAINER_TOTAL,
+    DOCKER_INFO_EVENTS,
     DOCKER_INFO_IMAGES,
+    DOCKER_INFO_REFRESH,
     DOCKER_INFO_VERSION,
     DOCKER_STATS_1CPU_PERCENTAGE,
     DOCKER_STATS_CPU_PERCENTAGE,
     DOCKER_STATS_MEMORY,
     DOCKER_STATS_MEMORY_PERCENTAGE,
     DOMAIN,
+    EVENT_CREATE_DELAY,
+    EVENT_CREATE_RETRIES,
+    EVENT_RETRY_MAX,
+    MAX_CONCURRENT_REQUESTS,
     PRECISION,
     VERSION,
 )
@@ -76,58 +90,145 @@ from .const import (
 _LOGGER = logging.getLogger(__name__)
 
 
+def backoff_delay(
+    base: float, attempt: int, cap: float = EVENT_RETRY_MAX, jitter: float = 0.5
+) -> float:
+    """Exponential backoff delay with random jitter, never longer than cap."""
+    return min(cap, base * 2 ** min(attempt, 10) * (1 + random.random() * jitter))
+
+
+# Multiply factors for bytes to kBytes/MBytes, exact because they are powers of 2
+_KB = 1.0 / 1024.0
+_MB = 1.0 / 1048576.0
+
+
 def toKB(value: float, precision: int = PRECISION) -> float:
     """Converts bytes to kBytes."""
-    precision = None if precision == 0 else precision
-    return round(value / (1024 ** 1), precision)
+    return round(value * _KB, precision or None)
 
 
 def toMB(value: float, precision: int = PRECISION) -> float:
     """Converts bytes to MBytes."""
-    precision = None if precision == 0 else precision
-    return round(value / (1024 ** 2), precision)
+    return round(value * _MB, precision or None)
+
+
+# Units for the Docker age format, a month is 30 days and a year 365 days
+_UNITS = (
+    ("year", 31536000),
+    ("month", 2592000),
+    ("day", 86400),
+    ("hour", 3600),
+    ("minute", 60),
+    ("second", 1),
+)
+
+
+def _parse_ts(value: str) -> datetime:
+    """Parse a Docker RFC3339 timestamp, falling back to dateutil."""
+    try:
+        if value.endswith("Z"):
+            return datetime.fromisoformat(value[:-1] + "+00:00")
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return parser.parse(value)
+
+
+#################################################################
+@dataclass(slots=True)
+class ContainerStats:
+    """Stats of a container, gathered during one poll."""
+
+    read: datetime | None = None
+    cpu_percentage: float | None = None
+    one_cpu_percentage: float | None = None
+    memory: float | None = None
+    memory_percentage: float | None = None
+    network_speed_up: float | None = None
+    network_speed_down: float | None = None
+    network_total_up: float | None = None
+    network_total_down: float | None = None
+
+    # The CONTAINER_STATS_* keys, "1cpu_percentage" isn't a valid attribute name
+    _KEYS: ClassVar[dict[str, str]] = {
+        CONTAINER_STATS_CPU_PERCENTAGE: "cpu_percentage",
+        CONTAINER_STATS_1CPU_PERCENTAGE: "one_cpu_percentage",
+        CONTAINER_STATS_MEMORY: "memory",
+        CONTAINER_STATS_MEMORY_PERCENTAGE: "memory_percentage",
+        CONTAINER_STATS_NETWORK_SPEED_UP: "network_speed_up",
+        CONTAINER_STATS_NETWORK_SPEED_DOWN: "network_speed_down",
+        CONTAINER_STATS_NETWORK_TOTAL_UP: "network_total_up",
+        CONTAINER_STATS_NETWORK_TOTAL_DOWN: "network_total_down",
+        "read": "read",
+    }
+
+    def __getitem__(self, key: str) -> Any:
+        """Return a stat by its CONTAINER_STATS_* key, like the old dict."""
+        return getattr(self, self._KEYS[key])
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return a stat by its CONTAINER_STATS_* key, or the default."""
+        attr = self._KEYS.get(key)
+        if attr is None:
+            return default
+        return getattr(self, attr)
 
 
 #################################################################
 class DockerAPI:
     """Docker API abstraction allowing multiple Docker instances beeing monitored."""
 
+    # SSL contexts keyed by certificate path and the mtimes of the PEM files
+    _ssl_cache: dict[tuple, ssl.SSLContext] = {}
+    # The cache is updated from executor threads, by all instances
+    _ssl_cache_lock = threading.Lock()
+
     def __init__(self, hass: HomeAssistant, config: ConfigType):
         """Initialize the Docker API."""
 
         self._hass = hass
         self._config = config
         self._instance: str = config[CONF_NAME]
+        self._log = _LOGGER.getChild(self._instance)
         self._containers: dict[str, DockerContainerAPI] = {}
         self._tasks: dict[str, asyncio.Task] = {}
         self._info: dict[str, Any] = {}
         self._event_create: dict[str, int] = {}
-        self._event_destroy: dict[str, int] = {}
+        self._event_queue: asyncio.Queue[tuple[str, str, int]] = asyncio.Queue()
+        self._info_dirty = asyncio.Event()
+        self._semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
         self._dockerStopped = False
         self._subscribers: list[Callable] = []
         self._api: aiodocker.Docker = None
+        # Separate client for the stats streams, see _init_stream_api()
+        self._stream_api: aiodocker.Docker | None = None
 
         self._tcp_connector = None
         self._tcp_session = None
         self._tcp_ssl_context = None
 
-        _LOGGER.debug("[%s]: Helper version: %s", self._instance, VERSION)
+        self._log.debug("Helper version: %s", VERSION)
 
         self._interval: int = config[CONF_SCAN_INTERVAL]
         self._retry_interval: int = config[CONF_RETRY]
-        _LOGGER.debug(
-            "[%s]: CONF_SCAN_INTERVAL=%d, RETRY=%d",
-            self._instance,
+        self._log.debug(
+            "CONF_SCAN_INTERVAL=%d, RETRY=%d",
             self._interval,
             self._retry_interval,
         )
 
     #############################################################
     async def init(self, startCount: int = 0):
-        # Set to None when called twice, etc
+        # Close the previous instance when called twice, etc. A shared TCP
+        # session is kept open, it is reused for the new instance
+        if self._api is not None and self._api.session is not self._tcp_session:
+            try:
+                await self._api.close()
+            except Exception as err:
+                self._log.debug("Closing previous Docker API failed (%s)", err)
         self._api = None
+        await self._close_stream_api()
 
-        _LOGGER.debug("[%s]: DockerAPI init()", self._instance)
+        self._log.debug("DockerAPI init()")
 
         # Get URL
         url: str = self._config[CONF_URL]
@@ -136,30 +237,33 @@ class DockerAPI:
         if url is not None and url == "":
             url = None
 
+        # Parse the URL only once, the scheme defines the connection type
+        parts = urlsplit(url) if url is not None else None
+        scheme = parts.scheme if parts is not None else None
+
         # A Unix connection should contain 'unix://' in the URL
-        unixConnection = url is not None and url.find("unix://") == 0
+        unixConnection = scheme == "unix"
 
         # If it is not a Unix connection, it should be a TCP connection
         tcpConnection = url is not None and not unixConnection
 
         if unixConnection:
-            _LOGGER.debug("[%s]: Docker URL contains a Unix socket connection: '%s'", self._instance, url)
+            self._log.debug("Docker URL contains a Unix socket connection: '%s'", url)
 
             # Try to fix unix:// to unix:/// (3 are required by aiodocker)
-            if url.find("unix:///") == -1:
-                url = url.replace("unix://", "unix:///")
+            if parts.netloc:
+                url = url.replace("unix://", "unix:///", 1)
 
         elif tcpConnection:
-            _LOGGER.debug("[%s]: Docker URL contains a TCP connection: '%s'", self._instance, url)
+            self._log.debug("Docker URL contains a TCP connection: '%s'", url)
 
             # When we reconnect with tcp, we should delay - docker is maybe not fully ready
             if startCount > 0:
                 await asyncio.sleep(5)
 
         else:
-            _LOGGER.debug(
-                "[%s]: Docker URL is auto-detect (most likely using 'unix://var/run/docker.socket')",
-                self._instance,
+            self._log.debug(
+                "Docker URL is auto-detect (most likely using 'unix://var/run/docker.socket')",
             )
 
 
@@ -168,63 +272,37 @@ class DockerAPI:
         os.environ.pop("DOCKER_TLS_VERIFY", None)
         os.environ.pop("DOCKER_CERT_PATH", None)
 
-        # Setup Docker parameters
-        self._tcp_connector = None
-        self._tcp_session = None
-        self._tcp_ssl_context = None
-
         # If is a TCP connection, then do check TCP/SSL
         if tcpConnection:
             # Check if URL is valid
-            if not (
-                url.find("tcp:") == 0
-                or url.find("http:") == 0
-                or url.find("https:") == 0
-            ):
+            if scheme not in ("tcp", "http", "https"):
                 raise ValueError(
                     f"[{self._instance}] Docker URL '{url}' does not start with tcp:, http: or https:"
                 )
 
-            if self._config[CONF_CERTPATH] and url.find("http:") == 0:
+            if self._config[CONF_CERTPATH] and scheme != "https":
                 # fixup URL and warn
-                _LOGGER.warning(
-                    "[%s] Docker URL '%s' should be https instead of http when using certificate path",
-                    self._instance,
+                self._log.warning(
+                    "Docker URL '%s' should be https instead of %s when using certificate path",
                     url,
+                    scheme,
                 )
-                url = url.replace("http:", "https:")
-
-            if self._config[CONF_CERTPATH] and url.find("tcp:") == 0:
-                # fixup URL and warn
-                _LOGGER.warning(
-                    "[%s] Docker URL '%s' should be https instead of tcp when using certificate path",
-                    self._instance,
-                    url,
-                )
-                url = url.replace("tcp:", "https:")
+                url = urlunsplit(parts._replace(scheme="https"))
 
             if self._config[CONF_CERTPATH]:
-                _LOGGER.debug(
-                    "[%s]: Docker certification path is '%s' SSL/TLS will be used",
-                    self._instance,
+                self._log.debug(
+                    "Docker certification path is '%s' SSL/TLS will be used",
                     self._config[CONF_CERTPATH],
                 )
 
                 # Create our SSL context object
-                self._tcp_ssl_context = await self._hass.async_add_executor_job(
+                ssl_context = await self._hass.async_add_executor_job(
                     self._docker_ssl_context
                 )
+            else:
+                ssl_context = None
 
-            # Setup new TCP connection, otherwise timeout takes toooo long
-            self._tcp_connector = TCPConnector(ssl=self._tcp_ssl_context)
-            self._tcp_session = ClientSession(
-                connector=self._tcp_connector,
-                timeout=ClientTimeout(
-                    connect=5,
-                    sock_connect=5,
-                    total=10,
-                ),
-            )
+            await self._ensure_transport(ssl_context)
 
         try:
             # Initiate the aiodocker instance now. Could raise an exception
@@ -239,15 +317,26 @@ class DockerAPI:
             version: str | None = versionInfo.get("Version", None)
 
             # Pre 19.03 support memory calculation is dropped
-            _LOGGER.debug("[%s]: Docker version: %s", self._instance, version)
+            self._log.debug("Docker version: %s", version)
+
+            # Static information, it doesn't change during the daemon lifetime
+            info = await self._api.system.info()
+            self._info[DOCKER_INFO_VERSION] = info.get("ServerVersion")
+            self._info[ATTR_MEMORY_LIMIT] = info.get("MemTotal")
+            self._info[ATTR_ONLINE_CPUS] = info.get("NCPU")
+            self._info[ATTR_VERSION_OS] = info.get("OperatingSystem")
+            self._info[ATTR_VERSION_OS_TYPE] = info.get("OSType")
+            self._info[ATTR_VERSION_ARCH] = info.get("Architecture")
+            self._info[ATTR_VERSION_KERNEL] = info.get("KernelVersion")
+            self._set_docker_counters(info)
         except aiodocker.exceptions.DockerError as err:
-            _LOGGER.error(
-                "[%s]: Docker API connection failed: %s", self._instance, str(err)
-            )
+            self._log.error("Docker API connection failed: %s", err)
             raise ConfigEntryAuthFailed from err
         except Exception:
             raise
 
+        self._init_stream_api()
+
         # Get the list of containers to monitor
         containers = await self._api.containers.list(all=True)
 
@@ -262,12 +351,16 @@ class DockerAPI:
     #############################################################
     async def run(self):
 
-        _LOGGER.debug("[%s]: DockerAPI run()", self._instance)
+        self._log.debug("DockerAPI run()")
 
         # Start task to monitor events of create/delete/start/stop
         if "events" not in self._tasks:
             self._tasks["events"] = asyncio.create_task(self._run_docker_events())
 
+        # Start task to handle the create/destroy container events
+        if "event_worker" not in self._tasks:
+            self._tasks["event_worker"] = asyncio.create_task(self._event_worker())
+
         # Start task to monitor total/running containers
         if "info" not in self._tasks:
             self._tasks["info"] = asyncio.create_task(self._run_docker_info())
@@ -282,81 +375,156 @@ class DockerAPI:
             # We will monitor all containers, including excluded ones.
             # This is needed to get total CPU/Memory usage.
 
-            _LOGGER.debug("[%s] %s: Container monitored", self._instance, cname)
+            self._log.debug("%s: Container monitored", cname)
 
             # Create our Docker Container API
             self._containers[cname] = DockerContainerAPI(
                 self._config,
                 self._api,
                 cname,
+                semaphore=self._semaphore,
+                stream_api=self._stream_api,
             )
             await self._containers[cname].init()
 
         self._hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, self._monitor_stop)
 
-    #############################################################
-    async def load(self):
-
-        _LOGGER.debug("[%s]: DockerAPI load()", self._instance)
-
-        for component in COMPONENTS:
-            load_platform(
-                self._hass,
-                component,
-                DOMAIN,
-                {CONF_NAME: self._instance},
-                self._config,
-            )
-
     #############################################################
     async def destroy(self) -> None:
         """Destroy the DockerAPI and its containers."""
 
         # Cancel all main tasks
-        for key in self._tasks:
+        tasks = list(self._tasks.values())
+        for key, task in self._tasks.items():
             try:
-                _LOGGER.debug("[%s]: Cancelling task '%s'", self._instance, key)
-                result = self._tasks[key].cancel()
-                _LOGGER.debug(
-                    "[%s]: Cancelled task '%s' result=%s", self._instance, key, result
-                )
+                self._log.debug("Cancelling task '%s'", key)
+                result = task.cancel()
+                self._log.debug("Cancelled task '%s' result=%s", key, result)
             except Exception as err:
-                _LOGGER.error(
-                    "[%s]: Cancelling task '%s' FAILED '%s'",
-                    self._instance,
-                    key,
-                    str(err),
-                )
+                self._log.error("Cancelling task '%s' FAILED '%s'", key, err)
                 pass
 
-        # Cancel the containers
+        # Wait until the cancelled tasks are finished
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._tasks = {}
 
-        for container in self._containers.values():
-            _LOGGER.debug(
-                "[%s] %s: Container cancelled", self._instance, container._name
-            )
-            await container.destroy()
-            # TBD clear container from list?
+        # Cancel the containers concurrently
+        containers = [c for c in self._containers.values() if c is not None]
+        self._log.debug("Cancelling %d container(s)", len(containers))
+        await asyncio.gather(
+            *(container.destroy() for container in containers),
+            return_exceptions=True,
+        )
+        # TBD clear container from list?
 
         # Close session if initialized
         if self._tcp_session:
             self._tcp_session.detach()
 
+        await self._close_stream_api()
+
         # Clear api value
         # self._api = None
 
+    #############################################################
+    async def _ensure_transport(self, ssl_context: ssl.SSLContext | None) -> None:
+        """Create the TCP connector/session, which is reused on reconnects."""
+
+        if (
+            self._tcp_session is not None
+            and not self._tcp_session.closed
+            and self._tcp_ssl_context is ssl_context
+        ):
+            self._log.debug("Reusing TCP session")
+            return
+
+        # The SSL context has changed, the old session can not be used anymore
+        if self._tcp_session is not None and not self._tcp_session.closed:
+            await self._tcp_session.close()
+
+        # Setup new TCP connection, otherwise timeout takes toooo long
+        self._tcp_ssl_context = ssl_context
+        self._tcp_connector = TCPConnector(ssl=ssl_context, keepalive_timeout=75)
+        self._tcp_session = ClientSession(
+            connector=self._tcp_connector,
+            timeout=ClientTimeout(
+                connect=5,
+                sock_connect=5,
+                total=10,
+            ),
+        )
+
+    #############################################################
+    def _init_stream_api(self) -> None:
+        """
+        Create the client for the stats streams. Every running container keeps
+        a stream open, so it needs a connector without a connection limit and
+        a session without a total timeout (the regular one ends after 10s)
+        """
+
+        connector = self._api.session.connector
+        if isinstance(connector, UnixConnector):
+            url = "unix://localhost"
+            connector = UnixConnector(path=connector.path, limit=0)
+        elif isinstance(connector, TCPConnector):
+            url = self._api.docker_host
+            connector = TCPConnector(
+                ssl=self._tcp_ssl_context, keepalive_timeout=75, limit=0
+            )
+        else:
+            # Unknown transport, the stats are polled instead
+            self._log.debug("No stats stream for %s", type(connector).__name__)
+            return
+
+        self._stream_api = aiodocker.Docker(
+            url=url,
+            connector=connector,
+            session=ClientSession(
+                connector=connector,
+                timeout=ClientTimeout(connect=5, sock_connect=5, total=None),
+            ),
+        )
+
+    #############################################################
+    async def _close_stream_api(self) -> None:
+        """Close the stats stream client, if any."""
+
+        if self._stream_api is None:
+            return
+
+        try:
+            await self._stream_api.close()
+        except Exception as err:
+            self._log.debug("Closing stats stream client failed (%s)", err)
+        self._stream_api = None
+
     #############################################################
     def _docker_ssl_context(self) -> ssl.SSLContext | None:
         """
-        Create a SSLContext object
+        Create a SSLContext object, or return the cached one when the
+        certificate files did not change since it was created
         """
 
+        path2 = Path(self._config[CONF_CERTPATH])
+
+        key = (
+            str(path2),
+            (path2 / "ca.pem").stat().st_mtime_ns,
+            (path2 / "cert.pem").stat().st_mtime_ns,
+            (path2 / "key.pem").stat().st_mtime_ns,
+        )
+
+        context = DockerAPI._ssl_cache.get(key)
+        if context is not None:
+            self._log.debug("Reusing cached SSL context")
+            return context
+
         context = ssl.create_default_context(purpose=ssl.Purpose.SERVER_AUTH)
         context.set_ciphers(ssl._RESTRICTED_SERVER_CIPHERS)  # type: ignore
 
-        path2 = Path(self._config[CONF_CERTPATH])
-
-        context.load_verify_locations(cafile=str(path2 / "ca.pem"))
+        # The CA is read once and passed as PEM data, the certificate chain
+        # can only be loaded from files
+        context.load_verify_locations(cadata=(path2 / "ca.pem").read_text())
         context.load_cert_chain(
             certfile=str(path2 / "cert.pem"), keyfile=str(path2 / "key.pem")
         )
@@ -364,55 +532,84 @@ class DockerAPI:
         context.verify_flags &= ~ssl.VERIFY_X509_STRICT
         context.check_hostname = False
 
+        with DockerAPI._ssl_cache_lock:
+            # Drop outdated contexts of the same certificate path
+            for oldkey in [k for k in DockerAPI._ssl_cache if k[0] == key[0]]:
+                del DockerAPI._ssl_cache[oldkey]
+
+            DockerAPI._ssl_cache[key] = context
+
         return context
 
     #############################################################
     def _monitor_stop(self, _service_or_event: Event) -> None:
         """Stop the monitor thread."""
 
-        _LOGGER.info("[%s]: Stopping Monitor Docker thread", self._instance)
+        self._log.info("Stopping Monitor Docker thread")
 
     #############################################################
     async def _reconnectx(self):
+        attempt = 0
+
         while True:
-            _LOGGER.debug("[%s] Reconnecting", self._instance)
+            self._log.debug("Reconnecting")
 
             try:
                 await self.init()
                 break
             except Exception as err:
-                _LOGGER.error(
-                    "[%s] Failed Docker connect (%s). Retry in %d seconds",
-                    self._instance,
-                    str(err),
-                    self._retry_interval,
+                # Only an auth/permission failure is permanent, init() also wraps
+                # "Cannot connect" (status 900) while the daemon is restarting
+                cause = err.__cause__ if isinstance(err, ConfigEntryAuthFailed) else err
+                if (
+                    isinstance(cause, aiodocker.exceptions.DockerError)
+                    and cause.status in (401, 403)
+                ):
+                    self._log.error("Failed Docker connect (%s). Not retrying", err)
+                    return
+
+                # Back off up to the retry interval, the jitter prevents multiple
+                # instances reconnecting at the same time after a docker restart
+                delay = backoff_delay(1, attempt, cap=max(self._retry_interval, 1))
+                self._log.error(
+                    "Failed Docker connect (%s). Retry in %.1f seconds",
+                    err,
+                    delay,
                 )
-                await asyncio.sleep(self._retry_interval)
+                await asyncio.sleep(delay)
+                attempt += 1
 
-        _LOGGER.debug("[%s] Reconnect success", self._instance)
+        self._log.debug("Reconnect success")
 
     #############################################################
     def remove_entities(self) -> None:
         """Remove docker info entities."""
 
         if len(self._subscribers) > 0:
-            _LOGGER.debug(
-                "[%s]: Removing entities from Docker info",
-                self._instance,
-            )
+            self._log.debug("Removing entities from Docker info")
 
         for callback in self._subscribers:
             callback(remove=True)
 
-        self._subscriber: list[Callable] = []
+        self._subscribers.clear()
 
     #############################################################
     def register_callback(self, callback: Callable, variable: str) -> None:
         """Register callback from sensor."""
         if callback not in self._subscribers:
-            _LOGGER.debug("[%s]: Added callback entity: %s", self._instance, variable)
+            self._log.debug("Added callback entity: %s", variable)
             self._subscribers.append(callback)
 
+    #############################################################
+    def _notify(self) -> None:
+        # A failing entity should not break the info loop of the others
+        for callback in self._subscribers:
+            try:
+                callback()
+            except Exception as err:
+                exc_info = not err.args
+                self._log.error("Notify entity failed (%s)", err, exc_info=exc_info)
+
     #############################################################
     async def _run_docker_events(self) -> None:
         """Function to retrieve docker events. We can add or remove monitored containers."""
@@ -421,283 +618,258 @@ class DockerAPI:
             subscriber = self._api.events.subscribe()
 
             while True:
-                event: dict = await subscriber.get()
+                event: dict | None = await subscriber.get()
 
-                # Dump all raw events
+                # When we receive none, the connection normally is broken
                 if event is None:
-                    _LOGGER.debug("[%s] run_docker_events RAW: None", self._instance)
-                else:
+                    break
+
+                # Dump all raw events
+                if self._log.isEnabledFor(logging.DEBUG):
                     # If Type=container, give some additional information
                     addlog = ""
-                    if event["Type"] == "container":
-                        try:
-                            addlog = f", Name={event['Actor']['Attributes']['name']}"
-                        except:
-                            pass
-
-                    _LOGGER.debug(
-                        "[%s] run_docker_events Type=%s%s, Action=%s",
-                        self._instance,
-                        event["Type"],
+                    if event.get("Type") == CONTAINER:
+                        name = (
+                            (event.get("Actor") or {}).get("Attributes") or {}
+                        ).get("name")
+                        if name:
+                            addlog = f", Name={name}"
+
+                    self._log.debug(
+                        "run_docker_events Type=%s%s, Action=%s",
+                        event.get("Type"),
                         addlog,
-                        event["Action"],
+                        event.get("Action"),
                     )
 
-                # When we receive none, the connection normally is broken
-                if event is None:
-                    _LOGGER.error("[%s]: run_docker_events loop ended", self._instance)
+                # Only monitor container events
+                if event["Type"] != CONTAINER:
+                    continue
+
+                action = event["Action"]
+                attrs = (event.get("Actor") or {}).get("Attributes") or {}
+
+                # Wake up the docker info task, the counters have changed
+                if action in DOCKER_INFO_EVENTS:
+                    self._info_dirty.set()
+
+                handler = self._CONTAINER_EVENTS.get(action)
+                if handler is None:
+                    continue
+
+                cname = attrs.get("name")
+                if cname:
+                    handler(self, cname, attrs)
+
+            self._log.error("run_docker_events loop ended")
+
+            # Set this to know if we stopped or HASS is stopping
+            self._dockerStopped = True
+
+            # Remove the docker info sensors
+            self.remove_entities()
+
+            # Remove all the sensors/switches/buttons, they will be auto created if connection is working again
+            self._event_create.clear()
+            for cname in list(self._containers.keys()):
+                try:
+                    await self._container_remove(cname)
+                except Exception as err:
+                    exc_info = not err.args
+                    self._log.error(
+                        "Stopping gave an error %s",
+                        err,
+                        exc_info=exc_info,
+                    )
 
-                    # Set this to know if we stopped or HASS is stopping
-                    self._dockerStopped = True
+            # Stop everything and return to the main thread
+            self._monitor_stop(self._config[CONF_NAME])
 
-                    # Remove the docker info sensors
-                    self.remove_entities()
+            # TODO: improve reconnectx
+            await self._reconnectx()
 
-                    # Remove all the sensors/switches/buttons, they will be auto created if connection is working again
-                    for cname in list(self._containers.keys()):
-                        try:
-                            await self._container_remove(cname)
-                        except Exception as err:
-                            exc_info = True if str(err) == "" else False
-                            _LOGGER.error(
-                                "[%s]: Stopping gave an error %s",
-                                self._instance,
-                                str(err),
-                                exc_info=exc_info,
-                            )
+        except Exception as err:
+            exc_info = not err.args
+            self._log.error("run_docker_events (%s)", err, exc_info=exc_info)
 
-                    # Stop everything and return to the main thread
-                    self._monitor_stop(self._config[CONF_NAME])
+    #############################################################
+    def _event_container_create(self, cname: str, attrs: dict[str, str]) -> None:
+        """Handle a container create event."""
+        self._event_queue_create(cname)
 
-                    # TODO: improve reconnectx
-                    await self._reconnectx()
+    #############################################################
+    def _event_container_destroy(self, cname: str, attrs: dict[str, str]) -> None:
+        """Handle a container destroy event."""
+
+        # Remove container name to containers to be monitored, this is
+        # handled by the event worker to not block our event monitoring
+        if cname in self._event_create:
+            self._log.warning(
+                "%s: Event destroy received, but create wasn't executed yet",
+                cname,
+            )
+            del self._event_create[cname]
+        else:
+            self._log.debug("%s: Event destroy container", cname)
+            self._event_queue.put_nowait(("destroy", cname, 0))
 
-                    break
+    #############################################################
+    def _event_container_rename(self, cname: str, attrs: dict[str, str]) -> None:
+        """Handle a container rename event."""
 
-                # Only monitor container events
-                if event["Type"] == CONTAINER:
-                    if event["Action"] == "create":
-                        # Check if another task is running, ifso, we don't create a new one
-                        taskcreated = (
-                            True if self._event_create or self._event_destroy else False
-                        )
-
-                        cname = event["Actor"]["Attributes"]["name"]
-
-                        # Add container name to containers to be monitored this has to
-                        # be a new task, otherwise it will block our event monitoring
-                        if cname not in self._event_create:
-                            _LOGGER.debug(
-                                "[%s] %s: Event create container", self._instance, cname
-                            )
-                            self._event_create[cname] = 0
-                        else:
-                            _LOGGER.error(
-                                "[%s] %s: Event create container, but already in working table?",
-                                self._instance,
-                                cname,
-                            )
-
-                        if self._event_create and not taskcreated:
-                            await self._container_create_destroy()
-
-                    elif event["Action"] == "destroy":
-                        # Check if another task is running, ifso, we don't create a new one
-                        taskcreated = (
-                            True if self._event_create or self._event_destroy else False
-                        )
-
-                        cname = event["Actor"]["Attributes"]["name"]
-
-                        # Remove container name to containers to be monitored this has to
-                        # be a new task, otherwise it will block our event monitoring
-                        if cname in self._event_create:
-                            _LOGGER.warning(
-                                "[%s] %s: Event destroy received, but create wasn't executed yet",
-                                self._instance,
-                                cname,
-                            )
-                            del self._event_create[cname]
-                        elif cname not in self._event_destroy:
-                            _LOGGER.debug(
-                                "[%s] %s: Event destroy container",
-                                self._instance,
-                                cname,
-                            )
-                            self._event_destroy[cname] = 0
-                        else:
-                            _LOGGER.error(
-                                "%s: Event destroy container, but already in working table?",
-                                cname,
-                            )
-
-                        if self._event_destroy and not taskcreated:
-                            await self._container_create_destroy()
-                    elif event["Action"] == "rename":
-                        # during a docker-compose up -d <container> the old container can be renamed
-                        # sensors/switch/button should be removed before the new container is monitored
-
-                        # New name
-                        cname = event["Actor"]["Attributes"]["name"]
-
-                        # Old name, and remove leading slash
-                        oname = event["Actor"]["Attributes"]["oldName"]
-                        oname = oname[1:]
-
-                        if oname in self._containers:
-                            _LOGGER.debug(
-                                "[%s] %s: Event rename container to '%s'",
-                                self._instance,
-                                oname,
-                                cname,
-                            )
-
-                            # First remove the newly create container, has a temporary name
-                            if oname in self._event_create:
-                                _LOGGER.warning(
-                                    "[%s] %s: Event rename received, but create wasn't executed yet",
-                                    self._instance,
-                                    oname,
-                                )
-                                del self._event_create[cname]
-                            elif oname not in self._event_destroy:
-                                _LOGGER.debug(
-                                    "[%s] %s: Event rename (destroy) container",
-                                    self._instance,
-                                    oname,
-                                )
-                                self._event_destroy[oname] = 0
-                            else:
-                                _LOGGER.error(
-                                    "%s: Event rename (destroy) container, but already in working table?",
-                                    oname,
-                                )
-
-                            # taskcreate is not unavailable, so remove for now
-                            if self._event_destroy:
-                                await self._container_create_destroy()
-
-                            # Second re-add the container with the original name
-                            taskcreated = (
-                                True
-                                if self._event_create or self._event_destroy
-                                else False
-                            )
-
-                            if cname not in self._event_create:
-                                _LOGGER.debug(
-                                    "[%s] %s: Event rename (create) container",
-                                    self._instance,
-                                    cname,
-                                )
-                                self._event_create[cname] = 0
-                            else:
-                                _LOGGER.error(
-                                    "[%s] %s: Event rename (create) container, but already in working table?",
-                                    self._instance,
-                                    cname,
-                                )
-
-                            if self._event_create and not taskcreated:
-                                await self._container_create_destroy()
-                        else:
-                            _LOGGER.error(
-                                "[%s] %s: Event rename container doesn't exist in list?",
-                                self._instance,
-                                oname,
-                            )
+        # during a docker-compose up -d <container> the old container can be renamed
+        # sensors/switch/button should be removed before the new container is monitored
 
-        except Exception as err:
-            exc_info = True if str(err) == "" else False
-            _LOGGER.error(
-                "[%s]: run_docker_events (%s)",
-                self._instance,
-                str(err),
-                exc_info=exc_info,
+        # Old name, and remove leading slash
+        oname = attrs.get("oldName", "")[1:]
+
+        # First remove the old container, can have a temporary name
+        if oname in self._event_create:
+            self._log.warning(
+                "%s: Event rename received, but create wasn't executed yet",
+                oname,
+            )
+            del self._event_create[oname]
+        elif oname in self._containers:
+            self._log.debug(
+                "%s: Event rename (destroy) container to '%s'",
+                oname,
+                cname,
             )
+            self._event_queue.put_nowait(("destroy", oname, 0))
+        else:
+            self._log.error("%s: Event rename container doesn't exist in list?", oname)
+            return
+
+        # Second re-add the container with the new name
+        self._event_queue_create(cname)
+
+    # Container event actions we handle, other actions are ignored
+    _CONTAINER_EVENTS: dict[str, Callable] = {
+        "create": _event_container_create,
+        "destroy": _event_container_destroy,
+        "rename": _event_container_rename,
+    }
 
     #############################################################
-    async def _container_create_destroy(self) -> None:
+    def _event_queue_create(self, cname: str) -> None:
+        """Queue a container create, after a delay to let the container settle."""
+
+        if cname in self._event_create:
+            self._log.error(
+                "%s: Event create container, but already in working table?",
+                cname,
+            )
+            return
+
+        self._log.debug("%s: Event create container", cname)
+        self._event_create[cname] = 0
+
+        asyncio.get_running_loop().call_later(
+            EVENT_CREATE_DELAY, self._event_queue.put_nowait, ("create", cname, 0)
+        )
+
+    #############################################################
+    async def _event_worker(self) -> None:
         """Handles create or destroy of container events."""
 
-        try:
-            while self._event_create or self._event_destroy:
-                # Go through create loop first
-                for cname in self._event_create:
-                    if self._event_create[cname] > 2:
-                        del self._event_create[cname]
-                        await self._container_add(cname)
-                        break
-                    else:
-                        self._event_create[cname] += 1
-                else:
-                    # If all create, we can handle the destroy loop
-                    for cname in self._event_destroy:
-                        await self._container_remove(cname)
+        while True:
+            action, cname, attempt = await self._event_queue.get()
 
-                    self._event_destroy = {}
+            try:
+                if action == "destroy":
+                    await self._container_remove(cname)
+                    continue
+
+                # Skip it, a destroy/rename was received before the create was executed
+                if cname not in self._event_create:
+                    continue
+
+                if await self._container_add(cname):
+                    del self._event_create[cname]
+                elif attempt < EVENT_CREATE_RETRIES:
+                    delay = backoff_delay(EVENT_CREATE_DELAY, attempt)
+                    self._log.debug(
+                        "%s: Retry start of monitoring in %.1f seconds",
+                        cname,
+                        delay,
+                    )
+                    asyncio.get_running_loop().call_later(
+                        delay,
+                        self._event_queue.put_nowait,
+                        ("create", cname, attempt + 1),
+                    )
+                else:
+                    del self._event_create[cname]
 
-                # Sleep for 1 second, don't try to create it too fast
-                await asyncio.sleep(1)
+            except Exception as err:
+                exc_info = not err.args
+                self._log.error("event_worker (%s)", err, exc_info=exc_info)
 
-        except Exception as err:
-            exc_info = True if str(err) == "" else False
-            _LOGGER.error(
-                "[%s]: container_create_destroy (%s)",
-                self._instance,
-                str(err),
-                exc_info=exc_info,
-            )
+                # Drop the failed create, otherwise later creates are ignored
+                if action == "create":
+                    self._event_create.pop(cname, None)
 
     #############################################################
-    async def _container_add(self, cname: str) -> None:
+    async def _container_add(self, cname: str) -> bool:
         if cname in self._containers:
-            _LOGGER.error("[%s] %s: Container already monitored", self._instance, cname)
-            return
+            self._log.error("%s: Container already monitored", cname)
+            return True
 
-        _LOGGER.debug("[%s] %s: Starting Container Monitor", self._instance, cname)
+        self._log.debug("%s: Starting Container Monitor", cname)
 
         # Create our Docker Container API
         self._containers[cname] = DockerContainerAPI(
-            self._config, self._api, cname, atInit=False
+            self._config,
+            self._api,
+            cname,
+            atInit=False,
+            semaphore=self._semaphore,
+            stream_api=self._stream_api,
         )
 
         # We should wait until container is attached
         result = await self._containers[cname]._initGetContainer()
 
-        if result:
-            # Lets wait 1 second before we try to create sensors/switches/buttons
-            await asyncio.sleep(1)
+        if not result:
+            self._log.error("%s: Problem during start of monitoring", cname)
+            del self._containers[cname]
+            return False
 
-            for component in COMPONENTS:
-                load_platform(
+        # Lets wait 1 second before we try to create sensors/switches/buttons
+        await asyncio.sleep(1)
+
+        for component in COMPONENTS:
+            self._hass.async_create_task(
+                async_load_platform(
                     self._hass,
                     component,
                     DOMAIN,
                     {CONF_NAME: self._instance, CONTAINER: cname},
                     self._config,
                 )
-        else:
-            _LOGGER.error(
-                "[%s] %s: Problem during start of monitoring", self._instance, cname
             )
 
+        return True
+
     #############################################################
     async def _container_remove(self, cname: str) -> None:
         if cname in self._containers:
-            _LOGGER.debug("[%s] %s: Stopping Container Monitor", self._instance, cname)
+            self._log.debug("%s: Stopping Container Monitor", cname)
             self._containers[cname].cancel_task()
-            self._containers[cname].remove_entities()
+            await self._containers[cname].remove_entities()
             await asyncio.sleep(0.1)
             del self._containers[cname]
         else:
-            _LOGGER.error("[%s] %s: Container is NOT monitored", self._instance, cname)
+            self._log.error("%s: Container is NOT monitored", cname)
 
     #############################################################
     async def _run_docker_info(self) -> None:
         """Function to retrieve information like docker info."""
 
         loopInit = False
+        # The docker info is already retrieved by init()
+        lastInfo = time.monotonic()
         self._dockerStopped = False
 
         while True:
@@ -705,170 +877,118 @@ class DockerAPI:
 
             try:
                 if self._dockerStopped:
-                    _LOGGER.debug("[%s]: Stopping docker info thread", self._instance)
+                    self._log.debug("Stopping docker info thread")
                     break
 
-                info = await self._api.system.info()
-                self._info[DOCKER_INFO_VERSION] = info.get("ServerVersion")
-                self._info[DOCKER_INFO_CONTAINER_RUNNING] = info.get(
-                    "ContainersRunning"
+                now = time.monotonic()
+                if now - lastInfo >= DOCKER_INFO_REFRESH:
+                    # Full refresh, also includes the number of images
+                    self._info_dirty.clear()
+                    self._set_docker_counters(await self._api.system.info())
+                    lastInfo = now
+                elif self._info_dirty.is_set():
+                    # Container event, only the container counters can be changed
+                    self._info_dirty.clear()
+                    containers = await self._api.containers.list(all=True)
+                    states = [
+                        container._container.get("State") for container in containers
+                    ]
+                    running = states.count("running")
+                    paused = states.count("paused")
+
+                    self._info[DOCKER_INFO_CONTAINER_RUNNING] = running
+                    self._info[DOCKER_INFO_CONTAINER_PAUSED] = paused
+                    self._info[DOCKER_INFO_CONTAINER_STOPPED] = (
+                        len(states) - running - paused
+                    )
+                    self._info[DOCKER_INFO_CONTAINER_TOTAL] = len(states)
+
+                # Snapshot the containers, the list can change during events
+                snapshot = tuple(
+                    container
+                    for container in self._containers.values()
+                    if container is not None
                 )
-                self._info[DOCKER_INFO_CONTAINER_PAUSED] = info.get("ContainersPaused")
-                self._info[DOCKER_INFO_CONTAINER_STOPPED] = info.get(
-                    "ContainersStopped"
+                if len(snapshot) != len(self._containers):
+                    self._log.warning("run_docker_info container is not yet initilized")
+
+                # Now go through all running containers and sum the cpu/memory stats
+                stats_list = [
+                    container.stats
+                    for container in snapshot
+                    if container.info.get(CONTAINER_INFO_STATE) == "running"
+                ]
+                cpu_total = sum(
+                    (stats.cpu_percentage or 0.0 for stats in stats_list), 0.0
                 )
-                self._info[DOCKER_INFO_CONTAINER_TOTAL] = info.get("Containers")
-                self._info[DOCKER_INFO_IMAGES] = info.get("Images")
-
-                self._info[ATTR_MEMORY_LIMIT] = info.get("MemTotal")
-                self._info[ATTR_ONLINE_CPUS] = info.get("NCPU")
-                self._info[ATTR_VERSION_OS] = info.get("OperatingSystem")
-                self._info[ATTR_VERSION_OS_TYPE] = info.get("OSType")
-                self._info[ATTR_VERSION_ARCH] = info.get("Architecture")
-                self._info[ATTR_VERSION_KERNEL] = info.get("KernelVersion")
-
-                self._info[DOCKER_STATS_CPU_PERCENTAGE] = 0.0
-                self._info[DOCKER_STATS_1CPU_PERCENTAGE] = 0.0
-                self._info[DOCKER_STATS_MEMORY] = 0
-                self._info[DOCKER_STATS_MEMORY_PERCENTAGE] = 0.0
-
-                # Now go through all containers and get the cpu/memory stats
-                for container in self._containers.values():
-                    if container is None:
-                        _LOGGER.warning(
-                            "[%s]: run_docker_info container is not yet initilized",
-                            self._instance,
-                        )
-                    try:
-                        info = container.get_info()
-                        if info.get(CONTAINER_INFO_STATE) == "running":
-                            stats = container.get_stats()
-                            if stats.get(CONTAINER_STATS_CPU_PERCENTAGE) is not None:
-                                self._info[DOCKER_STATS_CPU_PERCENTAGE] += stats.get(
-                                    CONTAINER_STATS_CPU_PERCENTAGE
-                                )
-                            if stats.get(CONTAINER_STATS_MEMORY) is not None:
-                                self._info[DOCKER_STATS_MEMORY] += stats.get(
-                                    CONTAINER_STATS_MEMORY
-                                )
-                    except Exception as err:
-                        exc_info = True if str(err) == "" else False
-                        _LOGGER.error(
-                            "[%s]: run_docker_info memory/cpu of X (%s)",
-                            self._instance,
-                            str(err),
-                            exc_info=exc_info,
-                        )
+                memory_total = sum(stats.memory or 0 for stats in stats_list)
+
+                info = self._info
+                cfg = self._config
+                precision_cpu = cfg[CONF_PRECISION_CPU]
+                precision_mem = cfg[CONF_PRECISION_MEMORY_MB]
+                precision_memp = cfg[CONF_PRECISION_MEMORY_PERCENTAGE]
+                online_cpus = info[ATTR_ONLINE_CPUS]
 
                 # Calculate memory percentage
-                if (
-                    self._info[ATTR_MEMORY_LIMIT] is not None
-                    and self._info[ATTR_MEMORY_LIMIT] != 0
-                ):
-                    self._info[DOCKER_STATS_MEMORY_PERCENTAGE] = round(
-                        self._info[DOCKER_STATS_MEMORY]
-                        / toMB(self._info[ATTR_MEMORY_LIMIT], 4)
-                        * 100,
-                        self._config[CONF_PRECISION_MEMORY_PERCENTAGE],
+                memory_percentage = 0.0
+                memory_limit = info[ATTR_MEMORY_LIMIT]
+                if memory_limit is not None and memory_limit != 0:
+                    memory_percentage = round(
+                        memory_total / round(memory_limit * _MB, 4) * 100,
+                        precision_memp,
                     )
 
-                # Try to fix possible 0 values in history at start-up
-                if loopInit:
-                    self._info[DOCKER_STATS_CPU_PERCENTAGE] = round(
-                        self._info[DOCKER_STATS_CPU_PERCENTAGE],
-                        self._config[CONF_PRECISION_CPU],
-                    )
+                cpu = round(cpu_total, precision_cpu)
 
-                    # Calculate for 0-100%
-                    if self._info[DOCKER_STATS_CPU_PERCENTAGE] is None:
-                        self._info[DOCKER_STATS_1CPU_PERCENTAGE] = None
-                    else:
-                        self._info[DOCKER_STATS_1CPU_PERCENTAGE] = round(
-                            (
-                                self._info[DOCKER_STATS_CPU_PERCENTAGE]
-                                / self._info[ATTR_ONLINE_CPUS]
-                            ),
-                            self._config[CONF_PRECISION_CPU],
-                        )
-
-                    self._info[DOCKER_STATS_MEMORY] = round(
-                        self._info[DOCKER_STATS_MEMORY],
-                        self._config[CONF_PRECISION_MEMORY_MB],
-                    )
+                # Calculate for 0-100%
+                one_cpu = round(cpu / online_cpus, precision_cpu)
 
-                    self._info[DOCKER_STATS_MEMORY_PERCENTAGE] = round(
-                        self._info[DOCKER_STATS_MEMORY_PERCENTAGE],
-                        self._config[CONF_PRECISION_MEMORY_PERCENTAGE],
-                    )
-                else:
-                    self._info[DOCKER_STATS_CPU_PERCENTAGE] = (
-                        None
-                        if self._info[DOCKER_STATS_CPU_PERCENTAGE] == 0.0
-                        else round(
-                            self._info[DOCKER_STATS_CPU_PERCENTAGE],
-                            self._config[CONF_PRECISION_CPU],
-                        )
-                    )
+                memory = round(memory_total, precision_mem)
 
-                    # Calculate for 0-100%
-                    if self._info[DOCKER_STATS_CPU_PERCENTAGE] == 0.0:
-                        self._info[DOCKER_STATS_1CPU_PERCENTAGE] = None
-                    elif self._info[DOCKER_STATS_CPU_PERCENTAGE] is None:
-                        self._info[DOCKER_STATS_1CPU_PERCENTAGE] = None
-                    else:
-                        self._info[DOCKER_STATS_1CPU_PERCENTAGE] = round(
-                            (
-                                self._info[DOCKER_STATS_CPU_PERCENTAGE]
-                                / self._info[ATTR_ONLINE_CPUS]
-                            ),
-                            self._config[CONF_PRECISION_CPU],
-                        )
-
-                    self._info[DOCKER_STATS_MEMORY] = (
-                        None
-                        if self._info[DOCKER_STATS_MEMORY] == 0.0
-                        else round(
-                            self._info[DOCKER_STATS_MEMORY],
-                            self._config[CONF_PRECISION_MEMORY_MB],
-                        )
+                # Try to fix possible 0 values in history at start-up
+                if not loopInit:
+                    cpu = None if cpu == 0.0 else cpu
+                    one_cpu = None if one_cpu == 0.0 else one_cpu
+                    memory = None if memory == 0.0 else memory
+                    memory_percentage = (
+                        None if memory_percentage == 0.0 else memory_percentage
                     )
 
-                    self._info[DOCKER_STATS_MEMORY_PERCENTAGE] = (
-                        None
-                        if self._info[DOCKER_STATS_MEMORY_PERCENTAGE] == 0.0
-                        else round(
-                            self._info[DOCKER_STATS_MEMORY_PERCENTAGE],
-                            self._config[CONF_PRECISION_MEMORY_PERCENTAGE],
-                        )
+                info[DOCKER_STATS_CPU_PERCENTAGE] = cpu
+                info[DOCKER_STATS_1CPU_PERCENTAGE] = one_cpu
+                info[DOCKER_STATS_MEMORY] = memory
+                info[DOCKER_STATS_MEMORY_PERCENTAGE] = memory_percentage
+
+                if self._log.isEnabledFor(logging.DEBUG):
+                    self._log.debug(
+                        "Version: %s, Containers: %s, Running: %s, CPU: %s%%, 1CPU: %s%%, Memory: %sMB, %s%%",
+                        info[DOCKER_INFO_VERSION],
+                        info[DOCKER_INFO_CONTAINER_TOTAL],
+                        info[DOCKER_INFO_CONTAINER_RUNNING],
+                        cpu,
+                        one_cpu,
+                        memory,
+                        memory_percentage,
                     )
 
-                _LOGGER.debug(
-                    "[%s]: Version: %s, Containers: %s, Running: %s, CPU: %s%%, 1CPU: %s%%, Memory: %sMB, %s%%",
-                    self._instance,
-                    self._info[DOCKER_INFO_VERSION],
-                    self._info[DOCKER_INFO_CONTAINER_TOTAL],
-                    self._info[DOCKER_INFO_CONTAINER_RUNNING],
-                    self._info[DOCKER_STATS_CPU_PERCENTAGE],
-                    self._info[DOCKER_STATS_1CPU_PERCENTAGE],
-                    self._info[DOCKER_STATS_MEMORY],
-                    self._info[DOCKER_STATS_MEMORY_PERCENTAGE],
-                )
+                # Push the new information to the Docker sensors
+                self._notify()
 
                 loopInit = True
                 error = False
 
             except asyncio.TimeoutError as err:
-                _LOGGER.error(
-                    "[%s]: run_docker_info (%s) TCP Timeout. Retry in %d seconds",
-                    self._instance,
+                self._log.error(
+                    "run_docker_info (%s) TCP Timeout. Retry in %d seconds",
+                    err,
                     self._retry_interval,
                 )
             except Exception as err:
-                exc_info = True if str(err) == "" else False
-                _LOGGER.error(
-                    "[%s]: run_docker_info (%s). Retry in %d seconds",
-                    self._instance,
-                    str(err),
+                exc_info = not err.args
+                self._log.error(
+                    "run_docker_info (%s). Retry in %d seconds",
+                    err,
                     self._retry_interval,
                     exc_info=exc_info,
                 )
@@ -876,7 +996,22 @@ class DockerAPI:
             if error:
                 await asyncio.sleep(self._retry_interval)
             else:
-                await asyncio.sleep(self._interval)
+                # Wake up early when a container event changed the docker info
+                try:
+                    await asyncio.wait_for(
+                        self._info_dirty.wait(), timeout=self._interval
+                    )
+                except asyncio.TimeoutError:
+                    pass
+
+    #############################################################
+    def _set_docker_counters(self, info: dict[str, Any]) -> None:
+        """Store the container and image counters of the docker info."""
+        self._info[DOCKER_INFO_CONTAINER_RUNNING] = info.get("ContainersRunning")
+        self._info[DOCKER_INFO_CONTAINER_PAUSED] = info.get("ContainersPaused")
+        self._info[DOCKER_INFO_CONTAINER_STOPPED] = info.get("ContainersStopped")
+        self._info[DOCKER_INFO_CONTAINER_TOTAL] = info.get("Containers")
+        self._info[DOCKER_INFO_IMAGES] = info.get("Images")
 
     #############################################################
     def list_containers(self):
@@ -887,9 +1022,7 @@ class DockerAPI:
         if cname in self._containers:
             return self._containers[cname]
         else:
-            _LOGGER.error(
-                "[%s]: Trying to get a not existing container %s", self._instance, cname
-            )
+            self._log.error("Trying to get a not existing container %s", cname)
             return None
 
     #############################################################
@@ -911,19 +1044,49 @@ class DockerContainerAPI:
         api: aiodocker.Docker,
         cname: str,
         atInit=True,
+        semaphore: asyncio.Semaphore | None = None,
+        stream_api: aiodocker.Docker | None = None,
     ):
         self._config = config
         self._api = api
+        self._stream_api = stream_api
         self._instance: str = config[CONF_NAME]
         self._memChange: int = config[CONF_MEMORYCHANGE]
+        self._precision_cpu: int = config[CONF_PRECISION_CPU]
+        # A precision of 0 is stored as None, so round() returns an int
+        self._precision_memory_mb: int | None = config[CONF_PRECISION_MEMORY_MB] or None
+        self._precision_memory_percentage: int = config[
+            CONF_PRECISION_MEMORY_PERCENTAGE
+        ]
+        self._precision_network_kb: int | None = (
+            config[CONF_PRECISION_NETWORK_KB] or None
+        )
+        self._precision_network_mb: int | None = (
+            config[CONF_PRECISION_NETWORK_MB] or None
+        )
         self._name = cname
+        self._log = _LOGGER.getChild(f"{self._instance}.{cname}")
+        # Slug of instance and container, shared by the entity ids
+        self._slug = slugify(f"{self._instance}_{cname}")
         self._interval: int = config[CONF_SCAN_INTERVAL]
         self._retry_interval: int = config[CONF_RETRY]
         self._busy = False
         self._atInit = atInit
         self._task: asyncio.Task | None = None
-        self._subscribers: list[Callable] = []
+        self._stats_task: asyncio.Task | None = None
+        self._latest_stats: dict[str, Any] | None = None
+        # Shared with the other containers, limits the concurrent Docker requests
+        self._semaphore = semaphore or asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        # Callback -> entity variable, a dict keeps the order and is O(1) to check
+        self._subscribers: dict[Callable, str] = {}
+        # Coroutine callbacks, awaited when the entities are removed
+        self._async_subscribers: dict[Callable, str] = {}
         self._cpu_old: dict[str, int] = {}
+        # Scale factors, only recalculated when the cpus/limit change
+        self._online_cpus: int | None = None
+        self._cpu_scale = 0.0
+        self._memory_limit_raw: int | None = None
+        self._memory_scale = 0.0
         self._network_old: dict[str, int | datetime] = {}
         self._network_error = 0
         self._memory_error = 0
@@ -934,25 +1097,26 @@ class DockerContainerAPI:
         self._memory_percent_prev_breach = False
 
         self._info: dict[str, Any] = {}
-        self._stats: dict[str, Any] = {}
+        self._stats = ContainerStats()
+        # Parsed image, shared by all entities of this container
+        self._device_info_parts: tuple[str | None, ...] | None = None
+        self._device_info_image: str | None = None
 
     async def init(self):
         # During start-up we will wait on container attachment,
         # preventing concurrency issues the main HA loop (we are
         # othside that one with our threads)
 
-        _LOGGER.debug("[%s] %s: DockerContainerAPI init()", self._instance, self._name)
+        self._log.debug("DockerContainerAPI init()")
 
         if self._atInit:
             try:
                 self._container = await self._api.containers.get(self._name)
             except Exception as err:
-                exc_info = True if str(err) == "" else False
-                _LOGGER.error(
-                    "[%s] %s: Container not available anymore (1) (%s)",
-                    self._instance,
-                    self._name,
-                    str(err),
+                exc_info = not err.args
+                self._log.error(
+                    "Container not available anymore (1) (%s)",
+                    err,
                     exc_info=exc_info,
                 )
                 return  # Could be necessary to do something more here
@@ -968,20 +1132,13 @@ class DockerContainerAPI:
         try:
             self._container = await self._api.containers.get(self._name)
         except aiodocker.exceptions.DockerError as err:
-            _LOGGER.error(
-                "[%s] %s: Container not available anymore (2a) (%s)",
-                self._instance,
-                self._name,
-                str(err),
-            )
+            self._log.error("Container not available anymore (2a) (%s)", err)
             return False
         except Exception as err:
-            exc_info = True if str(err) == "" else False
-            _LOGGER.error(
-                "[%s] %s: Container not available anymore (2b) (%s)",
-                self._instance,
-                self._name,
-                str(err),
+            exc_info = not err.args
+            self._log.error(
+                "Container not available anymore (2b) (%s)",
+                err,
                 exc_info=exc_info,
             )
             return False
@@ -995,24 +1152,17 @@ class DockerContainerAPI:
 
         if self._task:
             try:
-                _LOGGER.debug("[%s] %s: Cancelling task", self._instance, self._name)
+                self._log.debug("Cancelling task")
                 result = self._task.cancel()
-                _LOGGER.debug(
-                    "[%s] %s: Cancelled task result=%s",
-                    self._instance,
-                    self._name,
-                    result,
-                )
+                self._log.debug("Cancelled task result=%s", result)
             except Exception as err:
-                _LOGGER.error(
-                    "[%s] %s: Cancelling task FAILED '%s'",
-                    self._instance,
-                    self._name,
-                    str(err),
-                )
+                self._log.error("Cancelling task FAILED '%s'", err)
                 pass
         else:
-            _LOGGER.error("[%s] %s: No task to cancel", self._instance, self._name)
+            self._log.error("No task to cancel")
+
+        if self._stats_task:
+            self._stats_task.cancel()
 
     #############################################################
     async def _run(self) -> None:
@@ -1025,59 +1175,41 @@ class DockerContainerAPI:
             try:
                 # Don't check container if we are doing a start/stop
                 if not self._busy:
-                    await self._run_container_info()
-
-                    # Only run stats if container is running
-                    if self._info[CONTAINER_INFO_STATE] in ("running", "paused"):
-                        await self._run_container_stats()
+                    await self._poll_once()
                 else:
-                    _LOGGER.debug(
-                        "[%s] %s: Waiting on stop/start of container",
-                        self._instance,
-                        self._name,
-                    )
+                    self._log.debug("Waiting on stop/start of container")
                     sendNotify = False
 
                 # No error, so normal interval
                 error = False
 
             except concurrent.futures._base.CancelledError:
-                _LOGGER.debug(
-                    "[%s] %s: Container received concurrent.futures._base.CancelledError",
-                    self._instance,
-                    self._name,
+                self._log.debug(
+                    "Container received concurrent.futures._base.CancelledError",
                 )
                 pass
                 break
             except aiodocker.exceptions.DockerError as err:
-                _LOGGER.error(
-                    "[%s] %s: Container not available anymore (3a) (%s). Retry in %d seconds",
-                    self._instance,
-                    self._name,
-                    str(err),
+                self._log.error(
+                    "Container not available anymore (3a) (%s). Retry in %d seconds",
+                    err,
                     self._retry_interval,
                 )
             except asyncio.exceptions.CancelledError as err:
-                _LOGGER.error(
-                    "[%s] %s: Container not available anymore (3c) CancelledError. Retry in %d seconds",
-                    self._instance,
-                    self._name,
+                self._log.error(
+                    "Container not available anymore (3c) CancelledError. Retry in %d seconds",
                     self._retry_interval,
                 )
             except asyncio.TimeoutError as err:
-                _LOGGER.error(
-                    "[%s] %s: Container not available anymore (3d) TimeoutError. Retry in %d seconds",
-                    self._instance,
-                    self._name,
+                self._log.error(
+                    "Container not available anymore (3d) TimeoutError. Retry in %d seconds",
                     self._retry_interval,
                 )
             except Exception as err:
-                exc_info = True if str(err) == "" else False
-                _LOGGER.error(
-                    "[%s] %s: Container not available anymore (3b) (%s). Retry in %d seconds",
-                    self._instance,
-                    self._name,
-                    str(err),
+                exc_info = not err.args
+                self._log.error(
+                    "Container not available anymore (3b) (%s). Retry in %d seconds",
+                    err,
                     self._retry_interval,
                     exc_info=exc_info,
                 )
@@ -1094,6 +1226,59 @@ class DockerContainerAPI:
             else:
                 await asyncio.sleep(self._interval)
 
+    #############################################################
+    async def _run_stats_stream(self) -> None:
+        """Keep a stats stream open, it stores the latest sample for the stats loop."""
+
+        container = self._stream_api.containers.container(self._container.id)
+
+        while True:
+            try:
+                async for sample in container.stats(stream=True):
+                    self._latest_stats = sample
+
+                self._log.debug("Stats stream ended")
+            except Exception as err:
+                exc_info = not err.args
+                self._log.debug("Stats stream failed (%s)", err, exc_info=exc_info)
+
+            # Reopen the stream, _poll_once() cancels it when the container stops
+            self._latest_stats = None
+            await asyncio.sleep(self._interval)
+
+    #############################################################
+    async def _poll_once(self) -> None:
+        """Gather container info, and stats if it is running."""
+
+        async with self._semaphore:
+            await self._run_container_info()
+
+            # Only run stats if container is running
+            if self._info[CONTAINER_INFO_STATE] in ("running", "paused"):
+                self._start_stats_stream()
+                await self._run_container_stats()
+            else:
+                self._stop_stats_stream()
+
+    #############################################################
+    def _start_stats_stream(self) -> None:
+        """Open the stats stream, if it is not already open."""
+
+        if self._stream_api is None:
+            return
+
+        if self._stats_task is None or self._stats_task.done():
+            self._stats_task = asyncio.create_task(self._run_stats_stream())
+
+    #############################################################
+    def _stop_stats_stream(self) -> None:
+        """Close the stats stream, a stopped container has no stats."""
+
+        if self._stats_task is not None:
+            self._stats_task.cancel()
+            self._stats_task = None
+        self._latest_stats = None
+
     #############################################################
     async def _run_container_info(self) -> None:
         """Get container information, but we can not get
@@ -1101,31 +1286,29 @@ class DockerContainerAPI:
         while listing all containers :-(.
         """
 
-        self._info = {}
-
         raw: dict = await self._container.show()
 
-        self._info[CONTAINER_INFO_STATE] = raw["State"]["Status"]
+        # Every field is overwritten in place, so readers never see a partial dict
+
+        # Interned, so the entities can compare the state by identity
+        self._info[CONTAINER_INFO_STATE] = sys.intern(raw["State"]["Status"])
         self._info[CONTAINER_INFO_IMAGE] = raw["Config"]["Image"]
         self._info[CONTAINER_INFO_IMAGE_HASH] = raw["Image"]
 
         if self._network_error <= 5:
-            if CONTAINER_INFO_NETWORK_AVAILABLE not in self._info:
-                self._info[CONTAINER_INFO_NETWORK_AVAILABLE] = (
-                    False
-                    if raw["HostConfig"]["NetworkMode"] in ["host", "none"]
-                    else True
-                )
+            self._info[CONTAINER_INFO_NETWORK_AVAILABLE] = (
+                False if raw["HostConfig"]["NetworkMode"] in ["host", "none"] else True
+            )
         else:
             self._info[CONTAINER_INFO_NETWORK_AVAILABLE] = False
 
-        try:
-            self._info[CONTAINER_INFO_HEALTH] = raw["State"]["Health"]["Status"]
-        except:
-            self._info[CONTAINER_INFO_HEALTH] = "unknown"
+        health = raw["State"].get("Health")
+        self._info[CONTAINER_INFO_HEALTH] = (
+            health.get("Status", "unknown") if health else "unknown"
+        )
 
         # We only do a calculation of startedAt, because we use it twice
-        startedAt = parser.parse(raw["State"]["StartedAt"])
+        startedAt = _parse_ts(raw["State"]["StartedAt"])
 
         # Determine the container status in the format:
         # Up 6 days
@@ -1140,11 +1323,11 @@ class DockerContainerAPI:
         elif self._info[CONTAINER_INFO_STATE] == "exited":
             self._info[CONTAINER_INFO_STATUS] = "Exited ({}) {} ago".format(
                 raw["State"]["ExitCode"],
-                self._calcdockerformat(parser.parse(raw["State"]["FinishedAt"])),
+                self._calcdockerformat(_parse_ts(raw["State"]["FinishedAt"])),
             )
         elif self._info[CONTAINER_INFO_STATE] == "created":
             self._info[CONTAINER_INFO_STATUS] = "Created {} ago".format(
-                self._calcdockerformat(parser.parse(raw["Created"]))
+                self._calcdockerformat(_parse_ts(raw["Created"]))
             )
         elif self._info[CONTAINER_INFO_STATE] == "restarting":
             self._info[CONTAINER_INFO_STATUS] = "Restarting"
@@ -1161,188 +1344,158 @@ class DockerContainerAPI:
             self._info[CONTAINER_INFO_UPTIME] = dt_util.as_local(startedAt).isoformat()
         else:
             self._info[CONTAINER_INFO_UPTIME] = None
-            _LOGGER.debug(
-                "[%s] %s: %s",
-                self._instance,
-                self._name,
-                self._info[CONTAINER_INFO_STATUS],
-            )
+            if self._log.isEnabledFor(logging.DEBUG):
+                self._log.debug("%s", self._info[CONTAINER_INFO_STATUS])
 
     #############################################################
     async def _run_container_stats(self) -> None:
-        # Initialize stats information
-        stats: dict[str, Any] = {}
-        stats["cpu"] = {}
-        stats["memory"] = {}
-        stats["network"] = {}
-        stats["read"] = {}
+        # Use the latest sample of the stats stream, each sample is used once
+        raw: dict[str, Any] | None = self._latest_stats
+        self._latest_stats = None
 
-        # Get container stats, only interested in [0]
-        rawarr = await self._container.stats(stream=False)
+        # No sample available (yet), request one. Only interested in [0]
+        if raw is None:
+            rawarr = await self._container.stats(stream=False)
 
-        # Could be out-of-range when stopping/renaming
-        try:
-            raw: dict[str, Any] = rawarr[0]
-        except IndexError:
-            return
+            # Could be empty when stopping/renaming
+            if not rawarr:
+                return
+
+            raw = rawarr[0]
 
-        stats["read"] = parser.parse(raw["read"])
+        read_ts = _parse_ts(raw["read"])
 
         # Gather CPU information
-        cpu_stats = {}
+        cpu_total: float | None = None
+        online_cpus: int | None = None
         try:
-            cpu_new = {}
-            cpu_new["total"] = raw["cpu_stats"]["cpu_usage"]["total_usage"]
-            cpu_new["system"] = raw["cpu_stats"]["system_cpu_usage"]
+            raw_cpu = raw["cpu_stats"]
+            cpu_new = {
+                "total": raw_cpu["cpu_usage"]["total_usage"],
+                "system": raw_cpu["system_cpu_usage"],
+            }
 
             # Compatibility wih older Docker API
-            if "online_cpus" in raw["cpu_stats"]:
-                cpu_stats["online_cpus"] = raw["cpu_stats"]["online_cpus"]
+            if "online_cpus" in raw_cpu:
+                online_cpus = raw_cpu["online_cpus"]
             else:
-                cpu_stats["online_cpus"] = len(
-                    raw["cpu_stats"]["cpu_usage"]["percpu_usage"] or []
-                )
+                online_cpus = len(raw_cpu["cpu_usage"]["percpu_usage"] or [])
+
+            if online_cpus != self._online_cpus:
+                self._online_cpus = online_cpus
+                self._cpu_scale = float(online_cpus) * 100.0
 
             # Calculate cpu usage, but first iteration we don't know it
             if self._cpu_old:
                 cpu_delta = float(cpu_new["total"] - self._cpu_old["total"])
                 system_delta = float(cpu_new["system"] - self._cpu_old["system"])
 
-                cpu_stats["total"] = round(0.0, PRECISION)
+                cpu_total = round(0.0, PRECISION)
                 if cpu_delta > 0.0 and system_delta > 0.0:
-                    cpu_stats["total"] = round(
-                        (cpu_delta / system_delta)
-                        * float(cpu_stats["online_cpus"])
-                        * 100.0,
-                        self._config[CONF_PRECISION_CPU],
+                    cpu_total = round(
+                        (cpu_delta / system_delta) * self._cpu_scale,
+                        self._precision_cpu,
                     )
 
             self._cpu_old = cpu_new
 
             if self._cpu_error > 0:
-                _LOGGER.debug(
-                    "[%s] %s: CPU error count %s reset to 0",
-                    self._instance,
-                    self._name,
-                    self._cpu_error,
-                )
+                self._log.debug("CPU error count %s reset to 0", self._cpu_error)
 
             self._cpu_error = 0
 
         except KeyError as err:
             # Something wrong with the raw data
             if self._cpu_error == 0:
-                _LOGGER.error(
-                    "[%s] %s: Cannot determine CPU usage for container (%s)",
-                    self._instance,
-                    self._name,
-                    str(err),
+                self._log.error(
+                    "Cannot determine CPU usage for container (%s)",
+                    err,
                 )
-                if "cpu_stats" in raw:
-                    _LOGGER.error(
-                        "[%s] %s: Raw 'cpu_stats' %s", self._name, raw["cpu_stats"]
-                    )
-                else:
-                    _LOGGER.error(
-                        "[%s] %s: No 'cpu_stats' found in raw packet",
-                        self._instance,
-                        self._name,
-                    )
+                if self._log.isEnabledFor(logging.ERROR):
+                    if "cpu_stats" in raw:
+                        self._log.error("Raw 'cpu_stats' %s", raw["cpu_stats"])
+                    else:
+                        self._log.error("No 'cpu_stats' found in raw packet")
 
             self._cpu_error += 1
 
         # Gather memory information
-        memory_stats: dict[str, float | None] = {}
+        memory_usage: float | None = None
+        memory_percent: float | None = None
 
         try:
-            memory_stats["usage"] = None
+            raw_memory = raw["memory_stats"]
 
             cache = 0
             # https://docs.docker.com/engine/reference/commandline/stats/
             # Version is 19.04 or higher, don't use "cache"
-            if "total_inactive_file" in raw["memory_stats"]["stats"]:
-                cache = raw["memory_stats"]["stats"]["total_inactive_file"]
-            elif "inactive_file" in raw["memory_stats"]["stats"]:
-                cache = raw["memory_stats"]["stats"]["inactive_file"]
-
-            memory_stats["usage"] = toMB(
-                raw["memory_stats"]["usage"] - cache,
-                self._config[CONF_PRECISION_MEMORY_MB],
-            )
-            memory_stats["limit"] = toMB(
-                raw["memory_stats"]["limit"], self._config[CONF_PRECISION_MEMORY_MB]
+            if "total_inactive_file" in raw_memory["stats"]:
+                cache = raw_memory["stats"]["total_inactive_file"]
+            elif "inactive_file" in raw_memory["stats"]:
+                cache = raw_memory["stats"]["inactive_file"]
+
+            memory_usage = round(
+                (raw_memory["usage"] - cache) * _MB, self._precision_memory_mb
             )
-            memory_stats["usage_percent"] = round(
-                float(memory_stats["usage"]) / float(memory_stats["limit"]) * 100.0,
-                self._config[CONF_PRECISION_MEMORY_PERCENTAGE],
+
+            if raw_memory["limit"] != self._memory_limit_raw:
+                memory_limit = round(
+                    raw_memory["limit"] * _MB, self._precision_memory_mb
+                )
+                self._memory_scale = 100.0 / float(memory_limit)
+                self._memory_limit_raw = raw_memory["limit"]
+
+            memory_percent = round(
+                float(memory_usage) * self._memory_scale,
+                self._precision_memory_percentage,
             )
 
             if self._memory_error > 0:
-                _LOGGER.debug(
-                    "[%s] %s: Memory error count %s reset to 0",
-                    self._instance,
-                    self._name,
-                    self._memory_error,
-                )
+                self._log.debug("Memory error count %s reset to 0", self._memory_error)
 
             self._memory_error = 0
 
         except (KeyError, TypeError) as err:
             if self._memory_error == 0:
-                _LOGGER.error(
-                    "[%s] %s: Cannot determine memory usage for container (%s)",
-                    self._instance,
-                    self._name,
-                    str(err),
+                self._log.error(
+                    "Cannot determine memory usage for container (%s)",
+                    err,
                 )
-                if "memory_stats" in raw:
-                    _LOGGER.error(
-                        "[%s] %s: Raw 'memory_stats' %s",
-                        self._instance,
-                        self._name,
-                        raw["memory_stats"],
-                    )
-                else:
-                    _LOGGER.error(
-                        "[%s] %s: No 'memory_stats' found in raw packet",
-                        self._instance,
-                        self._name,
-                    )
+                if self._log.isEnabledFor(logging.ERROR):
+                    if "memory_stats" in raw:
+                        self._log.error("Raw 'memory_stats' %s", raw["memory_stats"])
+                    else:
+                        self._log.error("No 'memory_stats' found in raw packet")
 
             self._memory_error += 1
 
-        _LOGGER.debug(
-            "[%s] %s: CPU: %s%%, Memory: %sMB, %s%%",
-            self._instance,
-            self._name,
-            cpu_stats.get("total", None),
-            memory_stats.get("usage", None),
-            memory_stats.get("usage_percent", None),
-        )
+        if self._log.isEnabledFor(logging.DEBUG):
+            self._log.debug(
+                "CPU: %s%%, Memory: %sMB, %s%%",
+                cpu_total,
+                memory_usage,
+                memory_percent,
+            )
 
         # Default value
         mem_breach = False
 
         # Try to figure out if we should report the memory value or not
-        if (
-            memory_stats.get("usage", None)
-            and self._memory_prev
-            and not self._memory_prev_breach
-        ):
-            mem_diff = abs((memory_stats["usage"] / self._memory_prev) - 1) * 100
-
-            if self._memChange < 100 and mem_diff >= self._memChange:
-                mem_breach = True
-
-            _LOGGER.debug(
-                "[%s] %s: Mem Diff: %s%%, Curr: %s, Prev: %s, Breach: %s",
-                self._instance,
-                self._name,
-                round(mem_diff, 3),
-                memory_stats.get("usage", None),
-                self._memory_prev,
-                mem_breach,
-            )
+        memory_prev = self._memory_prev
+        if memory_usage and memory_prev and not self._memory_prev_breach:
+            # A change of 100% or more disables the check, skip the calculation
+            if self._memChange < 100:
+                mem_diff = abs(memory_usage / memory_prev - 1.0) * 100.0
+                mem_breach = mem_diff >= self._memChange
+
+                if self._log.isEnabledFor(logging.DEBUG):
+                    self._log.debug(
+                        "Mem Diff: %s%%, Curr: %s, Prev: %s, Breach: %s",
+                        round(mem_diff, 3),
+                        memory_usage,
+                        memory_prev,
+                        mem_breach,
+                    )
 
         else:
             self._memory_prev_breach = False
@@ -1356,235 +1509,179 @@ class DockerContainerAPI:
 
         # Check if we should block the current value or not
         if mem_breach and not self._memory_prev_breach:
-            _LOGGER.debug(
-                "[%s] %s: Memory breach %s%%", self._instance, self._name, mem_breach
-            )
+            self._log.debug("Memory breach %s%%", mem_breach)
 
             # Store values into previous
             tmp1 = self._memory_prev
             tmp2 = self._memory_percent_prev
-            self._memory_prev = memory_stats.get("usage", None)
+            self._memory_prev = memory_usage
             self._memory_prev_breach = mem_breach
-            self._memory_percent_prev = memory_stats.get("usage_percent", None)
-            memory_stats["usage"] = tmp1
-            memory_stats["usage_percent"] = tmp2
+            self._memory_percent_prev = memory_percent
+            memory_usage = tmp1
+            memory_percent = tmp2
         else:
             # Store values into previous
-            self._memory_prev = memory_stats.get("usage", None)
+            self._memory_prev = memory_usage
             self._memory_prev_breach = mem_breach
-            self._memory_percent_prev = memory_stats.get("usage_percent", None)
+            self._memory_percent_prev = memory_percent
 
         # Gather network information, doesn't work in network=host mode
-        network_stats: dict[str, int | float] = {}
+        speed_tx: float | None = None
+        speed_rx: float | None = None
+        total_tx: float | None = None
+        total_rx: float | None = None
         if self._info[CONTAINER_INFO_NETWORK_AVAILABLE]:
             try:
-                network_new = {}
-                network_stats["total_tx"] = 0
-                network_stats["total_rx"] = 0
-                for if_name, data in raw["networks"].items():
-                    network_stats["total_tx"] += data["tx_bytes"]
-                    network_stats["total_rx"] += data["rx_bytes"]
-
-                network_new = {
-                    "read": stats["read"],
-                    "total_tx": network_stats["total_tx"],
-                    "total_rx": network_stats["total_rx"],
-                }
+                nets = raw["networks"].values()
+                bytes_tx = sum(data["tx_bytes"] for data in nets)
+                bytes_rx = sum(data["rx_bytes"] for data in nets)
 
-                if self._network_old:
-                    tx = network_new["total_tx"] - self._network_old["total_tx"]
-                    rx = network_new["total_rx"] - self._network_old["total_rx"]
-                    tim = (
-                        network_new["read"] - self._network_old["read"]
-                    ).total_seconds()
+                network_old = self._network_old
+                if network_old:
+                    tim = (read_ts - network_old["read"]).total_seconds()
 
                     # Calculate speed, also convert to kByte/sec
-                    network_stats["speed_tx"] = toKB(
-                        float(tx) / tim, self._config[CONF_PRECISION_NETWORK_KB]
+                    speed_tx = round(
+                        float(bytes_tx - network_old["total_tx"]) / tim * _KB,
+                        self._precision_network_kb,
                     )
-                    network_stats["speed_rx"] = toKB(
-                        float(rx) / tim, self._config[CONF_PRECISION_NETWORK_KB]
+                    speed_rx = round(
+                        float(bytes_rx - network_old["total_rx"]) / tim * _KB,
+                        self._precision_network_kb,
                     )
 
-                self._network_old = network_new
+                self._network_old = {
+                    "read": read_ts,
+                    "total_tx": bytes_tx,
+                    "total_rx": bytes_rx,
+                }
 
                 # Convert total to MB
-                network_stats["total_tx"] = toMB(
-                    network_stats["total_tx"], self._config[CONF_PRECISION_NETWORK_MB]
-                )
-                network_stats["total_rx"] = toMB(
-                    network_stats["total_rx"], self._config[CONF_PRECISION_NETWORK_MB]
-                )
+                total_tx = round(bytes_tx * _MB, self._precision_network_mb)
+                total_rx = round(bytes_rx * _MB, self._precision_network_mb)
 
             except KeyError as err:
-                _LOGGER.error(
-                    "[%s] %s: Can not determine network usage for container (%s)",
-                    self._instance,
-                    self._name,
-                    str(err),
+                self._log.error(
+                    "Can not determine network usage for container (%s)",
+                    err,
                 )
-                if "networks" in raw:
-                    _LOGGER.error(
-                        "[%s] %s: Raw 'networks' %s",
-                        raw["networks"],
-                        self._instance,
-                        self._name,
-                    )
-                else:
-                    _LOGGER.error(
-                        "[%s] %s: No 'networks' found in raw packet",
-                        self._instance,
-                        self._name,
-                    )
+                if self._log.isEnabledFor(logging.ERROR):
+                    if "networks" in raw:
+                        self._log.error("Raw 'networks' %s", raw["networks"])
+                    else:
+                        self._log.error("No 'networks' found in raw packet")
 
                 # Check how many times we got a network error, after 5 times it won't happen
                 # anymore, thus we disable error reporting
                 self._network_error += 1
                 if self._network_error > 5:
-                    _LOGGER.error(
-                        "[%s] %s: Too many errors on 'networks' stats, disabling monitoring",
-                        self._instance,
-                        self._name,
+                    self._log.error(
+                        "Too many errors on 'networks' stats, disabling monitoring",
                     )
                     self._info[CONTAINER_INFO_NETWORK_AVAILABLE] = False
 
-        # All information collected
-        stats["cpu"] = cpu_stats
-        stats["memory"] = memory_stats
-        stats["network"] = network_stats
-
-        stats[CONTAINER_STATS_CPU_PERCENTAGE] = cpu_stats.get("total")
-        if "online_cpus" in cpu_stats and cpu_stats.get("total") is not None:
-            stats[CONTAINER_STATS_1CPU_PERCENTAGE] = round(
-                cpu_stats.get("total") / cpu_stats["online_cpus"],
-                self._config[CONF_PRECISION_CPU],
-            )
-
-        stats[CONTAINER_STATS_MEMORY] = memory_stats.get("usage")
-        stats[CONTAINER_STATS_MEMORY_PERCENTAGE] = memory_stats.get("usage_percent")
-        stats[CONTAINER_STATS_NETWORK_SPEED_UP] = network_stats.get("speed_tx")
-        stats[CONTAINER_STATS_NETWORK_SPEED_DOWN] = network_stats.get("speed_rx")
-        stats[CONTAINER_STATS_NETWORK_TOTAL_UP] = network_stats.get("total_tx")
-        stats[CONTAINER_STATS_NETWORK_TOTAL_DOWN] = network_stats.get("total_rx")
-
-        self._stats = stats
+        one_cpu: float | None = None
+        if online_cpus and cpu_total is not None:
+            one_cpu = round(cpu_total / online_cpus, self._precision_cpu)
+
+        # All information collected, publish it at once
+        self._stats = ContainerStats(
+            read=read_ts,
+            cpu_percentage=cpu_total,
+            one_cpu_percentage=one_cpu,
+            memory=memory_usage,
+            memory_percentage=memory_percent,
+            network_speed_up=speed_tx,
+            network_speed_down=speed_rx,
+            network_total_up=total_tx,
+            network_total_down=total_rx,
+        )
 
     #############################################################
     def cancel_task(self) -> None:
         if self._task is not None:
-            _LOGGER.info(
-                "[%s] %s: Cancelling task for container info/stats",
-                self._instance,
-                self._name,
-            )
+            self._log.info("Cancelling task for container info/stats")
             self._task.cancel()
         else:
-            _LOGGER.info(
-                "[%s] %s: Task (not running) can not be cancelled for container info/stats",
-                self._instance,
-                self._name,
+            self._log.info(
+                "Task (not running) can not be cancelled for container info/stats",
             )
 
+        if self._stats_task is not None:
+            self._stats_task.cancel()
+
     #############################################################
     def rename_entities_containername(self) -> None:
         if len(self._subscribers) > 0:
-            _LOGGER.debug(
-                "[%s] %s: Renaming entities for container", self._instance, self._name
-            )
+            self._log.debug("Renaming entities for container")
 
         for callback in self._subscribers:
             callback(rename=True, name=self._name)
 
     #############################################################
-    def remove_entities(self) -> None:
-        if len(self._subscribers) > 0:
-            _LOGGER.debug(
-                "[%s] %s: Removing entities from container", self._instance, self._name
-            )
+    async def remove_entities(self) -> None:
+        if len(self._subscribers) > 0 or len(self._async_subscribers) > 0:
+            self._log.debug("Removing entities from container")
 
         for callback in self._subscribers:
             callback(remove=True)
 
-        self._subscriber: list[Callable] = []
+        # Entities with an async callback are removed directly
+        async_subscribers = self._async_subscribers
+        self._subscribers = {}
+        self._async_subscribers = {}
+
+        results = await asyncio.gather(
+            *(callback() for callback in async_subscribers), return_exceptions=True
+        )
+        for callback, result in zip(async_subscribers, results):
+            if isinstance(result, Exception):
+                self._log.error(
+                    "Removing entity '%s' failed (%s)",
+                    async_subscribers[callback],
+                    result,
+                    exc_info=result,
+                )
 
     #############################################################
-    async def _start(self) -> None:
-        """Separate loop to start container, because HA loop can't be used."""
+    async def start(self) -> None:
+        """Called from HA switch."""
+        self._log.info("Start container")
 
+        self._busy = True
         try:
             await self._container.start()
         except Exception as err:
-            _LOGGER.error(
-                "[%s] %s: Can not start container (%s)",
-                self._instance,
-                self._name,
-                str(err),
-            )
+            self._log.error("Can not start container (%s)", err)
         finally:
             self._busy = False
 
     #############################################################
-    async def start(self) -> None:
+    async def stop(self) -> None:
         """Called from HA switch."""
-        _LOGGER.info("[%s] %s: Start container", self._instance, self._name)
+        self._log.info("Stop container")
 
         self._busy = True
-        await self._start()
-
-    #############################################################
-    async def _stop(self) -> None:
-        """Separate loop to stop container, because HA loop can't be used."""
         try:
             await self._container.stop(t=10)
         except Exception as err:
-            _LOGGER.error(
-                "[%s] %s: Can not stop container (%s)",
-                self._instance,
-                self._name,
-                str(err),
-            )
+            self._log.error("Can not stop container (%s)", err)
         finally:
             self._busy = False
 
     #############################################################
-    async def stop(self) -> None:
-        """Called from HA switch."""
-        _LOGGER.info("[%s] %s: Stop container", self._instance, self._name)
+    async def restart(self, source: str = "service") -> None:
+        """Called from HA button or service call."""
+        self._log.info("Restart container (%s)", source)
 
         self._busy = True
-        await self._stop()
-
-    #############################################################
-    async def _restart(self) -> None:
-        """Separate loop to stop container, because HA loop can't be used."""
         try:
             await self._container.restart()
         except Exception as err:
-            _LOGGER.error(
-                "[%s] %s: Can not restart container (%s)",
-                self._instance,
-                self._name,
-                str(err),
-            )
+            self._log.error("Can not restart container (%s)", err)
         finally:
             self._busy = False
 
-    #############################################################
-    async def _restart_button(self) -> None:
-        """Called from HA button."""
-        _LOGGER.info("[%s] %s: Restart container", self._instance, self._name)
-
-        self._busy = True
-        await self._restart()
-
-    #############################################################
-    async def restart(self) -> None:
-        """Called from service call."""
-        _LOGGER.info("[%s] %s: Restart container", self._instance, self._name)
-
-        self._busy = True
-        await self._restart()
-
     #############################################################
     def get_name(self) -> str:
         """Return the container name."""
@@ -1594,6 +1691,8 @@ class DockerContainerAPI:
     def set_name(self, name: str) -> None:
         """Set the container name."""
         self._name = name
+        self._log = _LOGGER.getChild(f"{self._instance}.{name}")
+        self._slug = slugify(f"{self._instance}_{name}")
 
     #############################################################
     def get_info(self) -> dict:
@@ -1601,7 +1700,7 @@ class DockerContainerAPI:
         return self._info
 
     #############################################################
-    def get_stats(self) -> dict:
+    def get_stats(self) -> ContainerStats:
         """Return the container stats."""
         return self._stats
 
@@ -1610,27 +1709,88 @@ class DockerContainerAPI:
         """Return the container stats."""
         return self._api
 
+    #############################################################
+    @property
+    def name(self) -> str:
+        """The container name, attribute access for the hot paths."""
+        return self._name
+
+    #############################################################
+    @property
+    def info(self) -> dict:
+        """The container info, attribute access for the hot paths."""
+        return self._info
+
+    #############################################################
+    @property
+    def stats(self) -> ContainerStats:
+        """The container stats, attribute access for the hot paths."""
+        return self._stats
+
+    #############################################################
+    @property
+    def slug(self) -> str:
+        """The slugified instance and container name, for entity ids."""
+        return self._slug
+
+    #############################################################
+    @property
+    def api(self) -> DockerAPI:
+        """The Docker API, attribute access for the hot paths."""
+        return self._api
+
+    #############################################################
+    def get_device_info_parts(self) -> tuple[str | None, ...]:
+        """Return the (manufacturer, image, version) parsed from the image."""
+        image = self._info.get(CONTAINER_INFO_IMAGE)
+        if self._device_info_parts is not None and image == self._device_info_image:
+            return self._device_info_parts
+
+        container_manufacturer = None
+        container_image = None
+        container_version = None
+
+        if image is not None and image != "":
+            # Image can be of the form {Host}/{Publisher}/{Image}:{version},
+            # where host, publisher and version can be optional
+            head, _, last = image.rpartition("/")
+
+            # If there are 2 or more parts, we can get the publisher
+            if head:
+                container_manufacturer = head.rpartition("/")[2].capitalize()
+
+            # Split the last part again to retrieve possible version info
+            container_image, sep, version = last.partition(":")
+            if sep:
+                container_version = version
+
+        self._device_info_image = image
+        self._device_info_parts = (
+            container_manufacturer,
+            container_image,
+            container_version,
+        )
+        return self._device_info_parts
+
     #############################################################
     def register_callback(self, callback: Callable, variable: str):
-        """Register callback from sensor/switch/button."""
-        if callback not in self._subscribers:
-            _LOGGER.debug(
-                "[%s] %s: Added callback to container, entity: %s",
-                self._instance,
-                self._name,
-                variable,
-            )
-            self._subscribers.append(callback)
+        """Register callback from sensor/switch/button.
+
+        A coroutine callback is only awaited when the entities are removed.
+        """
+        if inspect.iscoroutinefunction(callback):
+            if callback not in self._async_subscribers:
+                self._log.debug("Added remove callback, entity: %s", variable)
+                self._async_subscribers[callback] = variable
+        elif callback not in self._subscribers:
+            if self._log.isEnabledFor(logging.DEBUG):
+                self._log.debug("Added callback to container, entity: %s", variable)
+            self._subscribers[callback] = variable
 
     #############################################################
     def _notify(self) -> None:
-        if len(self._subscribers) > 0:
-            _LOGGER.debug(
-                "[%s] %s: Send notify (%d) to container",
-                self._instance,
-                self._name,
-                len(self._subscribers),
-            )
+        if self._subscribers and self._log.isEnabledFor(logging.DEBUG):
+            self._log.debug("Send notify (%d) to container", len(self._subscribers))
 
         for callback in self._subscribers:
             callback()
@@ -1642,26 +1802,15 @@ class DockerContainerAPI:
         if dt is None:
             return "None"
 
-        delta = relativedelta.relativedelta(datetime.now(timezone.utc), dt)
+        seconds = int((datetime.now(timezone.utc) - dt).total_seconds())
 
-        if delta.years != 0:
-            return "{} {}".format(delta.years, "year" if delta.years == 1 else "years")
-        elif delta.months != 0:
-            return "{} {}".format(
-                delta.months, "month" if delta.months == 1 else "months"
-            )
-        elif delta.days != 0:
-            return "{} {}".format(delta.days, "day" if delta.days == 1 else "days")
-        elif delta.hours != 0:
-            return "{} {}".format(delta.hours, "hour" if delta.hours == 1 else "hours")
-        elif delta.minutes != 0:
-            return "{} {}".format(
-                delta.minutes, "minute" if delta.minutes == 1 else "minutes"
-            )
+        # The largest unit that fits, months and years are approximated
+        for unit, unit_seconds in _UNITS:
+            if seconds >= unit_seconds:
+                count = seconds // unit_seconds
+                return f"{count} {unit}{'' if count == 1 else 's'}"
 
-        return "{} {}".format(
-            delta.seconds, "second" if delta.seconds == 1 else "seconds"
-        )
+        return f"{seconds} second{'' if seconds == 1 else 's'}"
 
 
 #################################################################
@@ -1672,28 +1821,12 @@ class DockerContainerEntity(Entity):
         self, container: DockerContainerAPI, instance: str, cname: str
     ) -> None:
         """Initialize the base for Container entities."""
-        container_info = container.get_info()
-
-        container_manufacturer = None
-        container_image = None
-        container_version = None
+        (
+            container_manufacturer,
+            container_image,
+            container_version,
+        ) = container.get_device_info_parts()
 
-        image = container_info[CONTAINER_INFO_IMAGE]
-        if image is not None and image != "":
-            # Image can be of the form {Host}/{Publisher}/{Image}:{version},
-            # where host, publisher and version can be optional
-            image_parts = image.split("/")
-
-            # If there are more than 2 parts, we can get the publisher
-            if len(image_parts) > 1: 
-                container_manufacturer = image_parts[-2].capitalize()
-            
-            # Split the last part again to retrieve possible version info
-            parts = image_parts[-1].split(":")
-            if len(parts) == 2:
-                container_version = parts[1]
-            container_image = parts[0]
-        
         self._attr_device_info = DeviceInfo(
             identifiers={(DOMAIN, f"{instance}_container_{cname}")},
             name=cname.capitalize(),
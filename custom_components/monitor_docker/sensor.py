@@ -252,8 +252,12 @@ class DockerSensor(SensorEntity):
         """Register callbacks."""
         self._api.register_callback(self.event_callback, self.entity_description.key)
 
+    @property
+    def should_poll(self) -> bool:
+        return False
+
     def event_callback(self, remove=False) -> None:
-        """Callback to remove Docker entity."""
+        """Callback for update of Docker information."""
 
         # If already called before, do not remove it again
         if self._removed:
@@ -269,6 +273,9 @@ class DockerSensor(SensorEntity):
             self._removed = True
             return
 
+        self.update()
+        self.async_write_ha_state()
+
 
 #################################################################
 class DockerContainerSensor(SensorEntity, DockerContainerEntity):
@@ -293,17 +300,14 @@ class DockerContainerSensor(SensorEntity, DockerContainerEntity):
         self.entity_description = description
 
         if self.entity_description.key == CONTAINER_INFO_ALLINONE:
-            self._attr_unique_id = ENTITY_ID_FORMAT.format(
-                slugify(f"{self._instance}_{self._cname}_allinone")
-            )
+            slug = f"{container.slug}_allinone"
             self._attr_name = "AllInOne"
-            self.entity_id = f"sensor.{self._instance}_{self._cname}_allinone".replace(" ", "")
         else:
-            self._attr_unique_id = ENTITY_ID_FORMAT.format(
-                slugify(f"{self._instance}_{cname}_{self.entity_description.name}")
-            )
+            slug = f"{container.slug}_{slugify(self.entity_description.name)}"
             self._attr_name = self.entity_description.name
-            self.entity_id = f"sensor.{self._instance}_{self._cname}_{self.entity_description.name}".replace(" ", "")
+
+        self._attr_unique_id = ENTITY_ID_FORMAT.format(slug)
+        self.entity_id = f"sensor.{slug}"
 
         self._state = None
         self._state_extra = None
@@ -390,17 +394,17 @@ class DockerContainerSensor(SensorEntity, DockerContainerEntity):
         stats = {}
 
         try:
-            info = self._container.get_info()
+            info = self._container.info
 
             if info.get(CONTAINER_INFO_STATE) == "running":
-                stats = self._container.get_stats()
+                stats = self._container.stats
 
         except Exception as err:
             _LOGGER.error(
                 "[%s] %s: Cannot request container info (%s)",
                 self._instance,
                 self._cname,
-                str(err),
+                err,
             )
         else:
             if self.entity_description.key == CONTAINER_INFO_ALLINONE:
@@ -452,5 +456,5 @@ class DockerContainerSensor(SensorEntity, DockerContainerEntity):
                     "[%s] %s: Failed 'schedule_update_ha_state' (%s)",
                     self._instance,
                     self._cname,
-                    str(err),
+                    err,
                 )
@@ -1,8 +1,7 @@
 """Monitor Docker switch component."""
 
-import asyncio
 import logging
-import re
+import sys
 from typing import Any
 
 import voluptuous as vol
@@ -12,10 +11,8 @@ from homeassistant.components.switch import ENTITY_ID_FORMAT, SwitchEntity
 from homeassistant.const import CONF_NAME
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import config_validation as cv
-from homeassistant.helpers import entity_platform
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
-from homeassistant.util import slugify
 
 from .const import (
     API,
@@ -37,6 +34,10 @@ SERVICE_RESTART_SCHEMA = vol.Schema({ATTR_NAME: cv.string, ATTR_SERVER: cv.strin
 
 _LOGGER = logging.getLogger(__name__)
 
+# The container API interns the state, so "running" can be compared by identity
+_STATE_KEY = CONTAINER_INFO_STATE
+_RUNNING = sys.intern("running")
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -64,13 +65,17 @@ async def async_setup_platform(
         cname = parm.data[ATTR_NAME]
         cserver = parm.data.get(ATTR_SERVER, None)
 
-        server_name = name
+        # Resolve the server at call time, default to the first configured one
+        server_name = next(iter(hass.data[DOMAIN]), None)
         if cserver is not None:
             if cserver not in hass.data[DOMAIN]:
                 _LOGGER.error("Server '%s' is not configured", cserver)
                 return
             else:
                 server_name = cserver
+        elif server_name is None:
+            _LOGGER.error("Service restart failed, no server is configured")
+            return
 
         server_config = hass.data[DOMAIN][server_name][CONFIG]
         server_api = hass.data[DOMAIN][server_name][API]
@@ -117,19 +122,19 @@ async def async_setup_platform(
     else:
         clist = api.list_containers()
 
-    for cname in clist:
-        includeContainer = False
-        if cname in config[CONF_CONTAINERS] or not config[CONF_CONTAINERS]:
-            includeContainer = True
+    # Convert the filters once, instead of a list search per container
+    included = frozenset(config[CONF_CONTAINERS] or ())
+    excluded = frozenset(config[CONF_CONTAINERS_EXCLUDE] or ())
+    enabled_all = config[CONF_SWITCHENABLED] == True
+    enabled = frozenset() if enabled_all else frozenset(config[CONF_SWITCHENABLED])
 
-        if config[CONF_CONTAINERS_EXCLUDE] and cname in config[CONF_CONTAINERS_EXCLUDE]:
-            includeContainer = False
+    for cname in clist:
+        includeContainer = (not included or cname in included) and (
+            cname not in excluded
+        )
 
         if includeContainer:
-            if (
-                config[CONF_SWITCHENABLED] == True
-                or cname in config[CONF_SWITCHENABLED]
-            ):
+            if enabled_all or cname in enabled:
                 _LOGGER.debug("[%s] %s: Adding component Switch", instance, cname)
 
                 switches.append(
@@ -146,19 +151,24 @@ async def async_setup_platform(
         _LOGGER.info("[%s]: No containers set-up", instance)
         return False
 
-    async_add_entities(switches, True)
+    async_add_entities(switches, False)
 
     # platform = entity_platform.current_platform.get()
     # platform.async_register_entity_service(SERVICE_RESTART, {}, "async_restart")
-    hass.services.async_register(
-        DOMAIN, SERVICE_RESTART, async_restart, schema=SERVICE_RESTART_SCHEMA
-    )
+    # The service is shared by all servers and platforms, only register it once
+    if not hass.services.has_service(DOMAIN, SERVICE_RESTART):
+        hass.services.async_register(
+            DOMAIN, SERVICE_RESTART, async_restart, schema=SERVICE_RESTART_SCHEMA
+        )
 
     return True
 
 
 #################################################################
 class DockerContainerSwitch(SwitchEntity, DockerContainerEntity):
+    # The Home Assistant base classes keep their __dict__ for the _attr_* fields
+    __slots__ = ("_container", "_instance", "_cname", "_state", "_name")
+
     def __init__(
         self,
         container: DockerContainerAPI,
@@ -172,13 +182,11 @@ class DockerContainerSwitch(SwitchEntity, DockerContainerEntity):
         self._cname = cname
         self._state = False
 
-        self._attr_unique_id: str = ENTITY_ID_FORMAT.format(
-            slugify(f"{self._instance}_{self._cname}")
-        )
+        slug = container.slug
+        self._attr_unique_id: str = ENTITY_ID_FORMAT.format(slug)
         self._name = self._cname.capitalize()
         self._attr_has_entity_name = True
-        self.entity_id = f"switch.{self._instance}_{self._cname}"
-        self._removed = False
+        self.entity_id = f"switch.{slug}"
 
     @property
     def name(self) -> str:
@@ -204,48 +212,51 @@ class DockerContainerSwitch(SwitchEntity, DockerContainerEntity):
     async def async_turn_on(self, **kwargs: Any) -> None:
         await self._container.start()
         self._state = True
-        self.async_schedule_update_ha_state()
+        self.async_write_ha_state()
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         await self._container.stop()
         self._state = False
-        self.async_schedule_update_ha_state()
+        self.async_write_ha_state()
 
     async def async_added_to_hass(self) -> None:
         """Register callbacks."""
         self._container.register_callback(self.event_callback, "switch")
+        self._container.register_callback(self.async_remove_callback, "switch")
 
         # Call event callback for possible information available
         self.event_callback()
 
+    async def async_remove_callback(self) -> None:
+        """Callback for removal of the container."""
+        _LOGGER.info("[%s] %s: Removing switch entity", self._instance, self._cname)
+        await self.async_remove()
+
     def event_callback(self, name="", remove=False) -> None:
         """Callback for update of container information."""
 
+        # Removal is handled by async_remove_callback
         if remove:
-            # If already called before, do not remove it again
-            if self._removed:
-                return
-
-            _LOGGER.info("[%s] %s: Removing switch entity", self._instance, self._cname)
-            asyncio.create_task(self.async_remove())
-            self._removed = True
             return
 
         state = None
 
         try:
-            info = self._container.get_info()
+            info = self._container.info
         except Exception as err:
             _LOGGER.error(
                 "[%s] %s: Cannot request container info (%s)",
                 self._instance,
                 name,
-                str(err),
+                err,
             )
         else:
             if info is not None:
-                state = info.get(CONTAINER_INFO_STATE) == "running"
+                state = info.get(_STATE_KEY) is _RUNNING
+
+        # Skip the state write on an unknown or unchanged state
+        if state is None or state == self._state:
+            return
 
-        if state is not self._state:
-            self._state = state
-            self.async_schedule_update_ha_state()
+        self._state = state
+        self.async_write_ha_state()